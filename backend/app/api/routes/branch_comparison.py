@@ -1,11 +1,15 @@
 """Branch comparison endpoints for comparing branches."""
 
 import uuid
+from collections.abc import Collection
 from decimal import Decimal
+from operator import attrgetter
 from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
-from sqlmodel import select
+from sqlalchemy import Select
+from sqlalchemy.orm import aliased
+from sqlmodel import Session, select
 
 from app.api.deps import CurrentUser, SessionDep
 from app.models import WBE, CostElement
@@ -13,6 +17,47 @@ from app.services.branch_filtering import apply_branch_filters
 
 router = APIRouter(prefix="/branch-comparison", tags=["branch-comparison"])
 
+# Fields whose difference marks an entity as updated in the branch; each getter
+# returns them as one tuple so a change check is a single comparison
+_wbe_compared_fields = attrgetter("machine_type", "revenue_allocation")
+_ce_compared_fields = attrgetter("budget_bac", "revenue_plan")
+
+
+def _active_wbe_entity_ids(project_id: uuid.UUID, branch: str) -> Select[Any]:
+    """Subquery of entity_ids with an active WBE version in a project branch.
+
+    Filtering on this keeps the check in SQL instead of sending the entity_ids
+    loaded earlier back to the database as an IN list.
+    """
+    active_wbe = aliased(WBE)
+    return (
+        select(active_wbe.entity_id)
+        .where(active_wbe.project_id == project_id)
+        .where(active_wbe.branch == branch)
+        .where(active_wbe.status == "active")
+    )
+
+
+def _get_deleted_entity_ids(
+    session: Session,
+    model_class: type[WBE] | type[CostElement],
+    entity_ids: Collection[uuid.UUID],
+    branch: str,
+) -> set[uuid.UUID]:
+    """Return which of the given entity_ids have a deleted version in a branch."""
+    if not entity_ids:
+        return set()
+
+    return set(
+        session.exec(
+            select(model_class.entity_id)
+            .where(model_class.entity_id.in_(entity_ids))  # type: ignore[attr-defined]
+            .where(model_class.branch == branch)
+            .where(model_class.status == "deleted")
+            .distinct()
+        ).all()
+    )
+
 
 @router.get("/{project_id}/compare")
 def compare_branches(
@@ -37,25 +82,16 @@ def compare_branches(
     if branch == base_branch:
         raise HTTPException(status_code=400, detail="Cannot compare branch with itself")
 
-    # Get all active WBEs in branch
-    branch_wbes = session.exec(
-        apply_branch_filters(
-            select(WBE).where(WBE.project_id == project_id),
-            WBE,
-            branch=branch,
-            include_deleted=False,
-        )
-    ).all()
-
-    # Get all active WBEs in base branch
-    main_wbes = session.exec(
-        apply_branch_filters(
-            select(WBE).where(WBE.project_id == project_id),
-            WBE,
-            branch=base_branch,
-            include_deleted=False,
-        )
+    # Get all active WBEs of both branches in one query, then split by branch.
+    # Only the columns used in the comparison are loaded, not full ORM rows
+    wbes = session.execute(
+        select(WBE.entity_id, WBE.branch, WBE.machine_type, WBE.revenue_allocation)  # type: ignore[call-overload]
+        .where(WBE.project_id == project_id)
+        .where(WBE.branch.in_((branch, base_branch)))  # type: ignore[attr-defined]
+        .where(WBE.status == "active")
     ).all()
+    branch_wbes = [wbe for wbe in wbes if wbe.branch == branch]
+    main_wbes = [wbe for wbe in wbes if wbe.branch == base_branch]
 
     # Create maps
     main_wbe_map = {wbe.entity_id: wbe for wbe in main_wbes}
@@ -86,10 +122,7 @@ def compare_branches(
             total_revenue_change += Decimal(str(branch_wbe.revenue_allocation or 0))
         else:
             # Check if updated
-            if (
-                branch_wbe.machine_type != main_wbe.machine_type
-                or branch_wbe.revenue_allocation != main_wbe.revenue_allocation
-            ):
+            if _wbe_compared_fields(branch_wbe) != _wbe_compared_fields(main_wbe):
                 updates.append(
                     {
                         "type": "wbe",
@@ -108,54 +141,59 @@ def compare_branches(
                     )
                 )
 
-    # Find deletes
+    # Find deletes, checking all candidates against the branch in one query
+    deleted_wbe_entity_ids = _get_deleted_entity_ids(
+        session,
+        WBE,
+        main_wbe_map.keys() - branch_wbe_map.keys(),
+        branch,
+    )
     for main_wbe in main_wbes:
-        if main_wbe.entity_id not in branch_wbe_map:
-            # Check if deleted in branch
-            deleted_branch_wbe = session.exec(
-                select(WBE)
-                .where(WBE.entity_id == main_wbe.entity_id)
-                .where(WBE.branch == branch)
-                .where(WBE.status == "deleted")
-            ).first()
-
-            if deleted_branch_wbe:
-                deletes.append(
-                    {
-                        "type": "wbe",
-                        "entity_id": str(main_wbe.entity_id),
-                        "description": f"Delete WBE: {main_wbe.machine_type}",
-                        "revenue_change": -float(main_wbe.revenue_allocation or 0),
-                    }
-                )
-                total_revenue_change -= Decimal(str(main_wbe.revenue_allocation or 0))
+        if main_wbe.entity_id in deleted_wbe_entity_ids:
+            deletes.append(
+                {
+                    "type": "wbe",
+                    "entity_id": str(main_wbe.entity_id),
+                    "description": f"Delete WBE: {main_wbe.machine_type}",
+                    "revenue_change": -float(main_wbe.revenue_allocation or 0),
+                }
+            )
+            total_revenue_change -= Decimal(str(main_wbe.revenue_allocation or 0))
 
     # Similar logic for CostElements
-    branch_wbe_entity_ids = {wbe.entity_id for wbe in branch_wbes}
     branch_cost_elements_query = (
-        select(CostElement)
+        select(  # type: ignore[call-overload]
+            CostElement.entity_id,
+            CostElement.department_name,
+            CostElement.budget_bac,
+            CostElement.revenue_plan,
+        )
         .join(WBE, CostElement.wbe_id == WBE.wbe_id)
-        .where(WBE.entity_id.in_(list(branch_wbe_entity_ids)))  # type: ignore[attr-defined]
+        .where(WBE.entity_id.in_(_active_wbe_entity_ids(project_id, branch)))  # type: ignore[attr-defined]
         .where(WBE.project_id == project_id)
         .where(WBE.branch == branch)
     )
     branch_cost_elements_query = apply_branch_filters(
         branch_cost_elements_query, CostElement, branch=branch, include_deleted=False
     )
-    branch_cost_elements = session.exec(branch_cost_elements_query).all()
+    branch_cost_elements = session.execute(branch_cost_elements_query).all()
 
-    main_wbe_entity_ids = {wbe.entity_id for wbe in main_wbes}
     main_cost_elements_query = (
-        select(CostElement)
+        select(  # type: ignore[call-overload]
+            CostElement.entity_id,
+            CostElement.department_name,
+            CostElement.budget_bac,
+            CostElement.revenue_plan,
+        )
         .join(WBE, CostElement.wbe_id == WBE.wbe_id)
-        .where(WBE.entity_id.in_(list(main_wbe_entity_ids)))  # type: ignore[attr-defined]
+        .where(WBE.entity_id.in_(_active_wbe_entity_ids(project_id, base_branch)))  # type: ignore[attr-defined]
         .where(WBE.project_id == project_id)
         .where(WBE.branch == base_branch)
     )
     main_cost_elements_query = apply_branch_filters(
         main_cost_elements_query, CostElement, branch=base_branch, include_deleted=False
     )
-    main_cost_elements = session.exec(main_cost_elements_query).all()
+    main_cost_elements = session.execute(main_cost_elements_query).all()
 
     main_ce_map = {ce.entity_id: ce for ce in main_cost_elements}
     branch_ce_map = {ce.entity_id: ce for ce in branch_cost_elements}
@@ -176,10 +214,7 @@ def compare_branches(
             total_budget_change += Decimal(str(branch_ce.budget_bac or 0))
             total_revenue_change += Decimal(str(branch_ce.revenue_plan or 0))
         else:
-            if (
-                branch_ce.budget_bac != main_ce.budget_bac
-                or branch_ce.revenue_plan != main_ce.revenue_plan
-            ):
+            if _ce_compared_fields(branch_ce) != _ce_compared_fields(main_ce):
                 updates.append(
                     {
                         "type": "cost_element",
@@ -200,27 +235,25 @@ def compare_branches(
                     str((branch_ce.revenue_plan or 0) - (main_ce.revenue_plan or 0))
                 )
 
+    deleted_ce_entity_ids = _get_deleted_entity_ids(
+        session,
+        CostElement,
+        main_ce_map.keys() - branch_ce_map.keys(),
+        branch,
+    )
     for main_ce in main_cost_elements:
-        if main_ce.entity_id not in branch_ce_map:
-            deleted_branch_ce = session.exec(
-                select(CostElement)
-                .where(CostElement.entity_id == main_ce.entity_id)
-                .where(CostElement.branch == branch)
-                .where(CostElement.status == "deleted")
-            ).first()
-
-            if deleted_branch_ce:
-                deletes.append(
-                    {
-                        "type": "cost_element",
-                        "entity_id": str(main_ce.entity_id),
-                        "description": f"Delete Cost Element: {main_ce.department_name}",
-                        "budget_change": -float(main_ce.budget_bac or 0),
-                        "revenue_change": -float(main_ce.revenue_plan or 0),
-                    }
-                )
-                total_budget_change -= Decimal(str(main_ce.budget_bac or 0))
-                total_revenue_change -= Decimal(str(main_ce.revenue_plan or 0))
+        if main_ce.entity_id in deleted_ce_entity_ids:
+            deletes.append(
+                {
+                    "type": "cost_element",
+                    "entity_id": str(main_ce.entity_id),
+                    "description": f"Delete Cost Element: {main_ce.department_name}",
+                    "budget_change": -float(main_ce.budget_bac or 0),
+                    "revenue_change": -float(main_ce.revenue_plan or 0),
+                }
+            )
+            total_budget_change -= Decimal(str(main_ce.budget_bac or 0))
+            total_revenue_change -= Decimal(str(main_ce.revenue_plan or 0))
 
     return {
         "project_id": str(project_id),
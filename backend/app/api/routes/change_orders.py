@@ -58,7 +58,7 @@ def create_change_order(
     # Auto-generate change order number if not provided
     if not change_order_in.change_order_number:
         # Generate short project ID
-        project_short_id = str(project_id).replace("-", "")[:6].upper()
+        project_short_id = project_id.hex[:6].upper()
 
         # Get next progressive number for this project
         existing_cos = session.exec(
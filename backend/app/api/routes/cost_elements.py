@@ -93,21 +93,21 @@ def validate_revenue_plan_against_wbe_limit(
     if not wbe:
         raise HTTPException(status_code=400, detail="WBE not found")
 
-    # Query all cost elements for this WBE (excluding the one being updated if specified)
+    # Sum revenue_plan over the WBE's cost elements in the database (excluding
+    # the one being updated if specified) rather than loading every row
     # Note: This validation should consider only active cost elements in the same branch as the WBE
-    statement = select(CostElement).where(CostElement.wbe_id == wbe_id)
-    statement = apply_branch_filters(
-        statement, CostElement, branch=get_branch_context()
-    )
+    statement = select(
+        func.coalesce(func.sum(CostElement.revenue_plan), Decimal("0.00"))
+    ).where(CostElement.wbe_id == wbe_id)
     if exclude_cost_element_id:
         statement = statement.where(
             CostElement.cost_element_id != exclude_cost_element_id
         )
+    revenue_sum_statement = apply_branch_filters(
+        statement, CostElement, branch=get_branch_context()
+    )
 
-    cost_elements = session.exec(statement).all()
-
-    # Sum existing revenue_plan values
-    total_revenue_plan = sum(ce.revenue_plan for ce in cost_elements)
+    total_revenue_plan: Decimal = session.execute(revenue_sum_statement).scalar_one()
 
     # Add new_revenue_plan
     new_total = total_revenue_plan + new_revenue_plan
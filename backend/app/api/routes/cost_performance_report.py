@@ -5,6 +5,7 @@ from datetime import date
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 
 from app.api.deps import (
     CurrentUser,
@@ -13,7 +14,10 @@ from app.api.deps import (
 )
 from app.models import Project
 from app.models.cost_performance_report import CostPerformanceReportPublic
-from app.services.cost_performance_report import get_cost_performance_report
+from app.services.cost_performance_report import (
+    get_cost_performance_report,
+    iter_cost_performance_rows,
+)
 from app.services.time_machine import end_of_day
 
 router = APIRouter(prefix="/projects", tags=["reports"])
@@ -58,3 +62,34 @@ def get_project_cost_performance_report_endpoint(
         raise HTTPException(status_code=404, detail=str(e))
 
     return report
+
+
+@router.get(
+    "/{project_id}/reports/cost-performance/rows",
+    response_class=StreamingResponse,
+)
+def stream_project_cost_performance_rows_endpoint(
+    *,
+    session: SessionDep,
+    _current_user: CurrentUser,
+    project_id: uuid.UUID,
+    control_date: Annotated[date, Depends(get_time_machine_control_date)],
+) -> StreamingResponse:
+    """Stream the cost performance report rows of a project as NDJSON.
+
+    Each line is one CostPerformanceReportRowPublic, so clients can render
+    large projects before the whole report is built. The project summary is
+    available from the cost-performance endpoint.
+    """
+    # Ensure project exists and respect time-machine
+    project = _ensure_project_exists(session, project_id)
+    cutoff = end_of_day(control_date)
+    if project.created_at > cutoff:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    rows = iter_cost_performance_rows(session, project_id, control_date)
+
+    return StreamingResponse(
+        (row.model_dump_json() + "\n" for row in rows),
+        media_type="application/x-ndjson",
+    )
@@ -156,6 +156,39 @@ def validate_registration_date(
     return None
 
 
+def _get_actual_cost_map(
+    session: Session, cost_element_ids: list[uuid.UUID], control_date: date
+) -> dict[uuid.UUID, Decimal]:
+    """Get a map of cost_element_id -> actual cost (sum of registered amounts).
+
+    Args:
+        session: Database session
+        cost_element_ids: List of cost element IDs to sum registrations for
+        control_date: Control date for time-machine filtering
+
+    Returns:
+        Dictionary mapping cost_element_id -> total registered amount.
+        Returns empty dict if cost_element_ids is empty.
+        Cost elements without visible registrations map to Decimal("0.00").
+    """
+    if not cost_element_ids:
+        return {}
+
+    # Sum amounts in the database in one grouped query rather than loading
+    # every registration row
+    statement = apply_time_machine_filters(
+        select(CostRegistration.cost_element_id, func.sum(CostRegistration.amount))
+        .where(CostRegistration.cost_element_id.in_(cost_element_ids))  # type: ignore[attr-defined]
+        .group_by(CostRegistration.cost_element_id),  # type: ignore[arg-type]
+        TimeMachineEventType.COST_REGISTRATION,
+        control_date,
+    )
+
+    actual_cost_map = dict.fromkeys(cost_element_ids, Decimal("0.00"))
+    actual_cost_map.update(session.execute(statement).tuples().all())
+    return actual_cost_map
+
+
 @router.get("/", response_model=CostRegistrationsPublic)
 def read_cost_registrations(
     session: SessionDep,
@@ -3,6 +3,8 @@
 import uuid
 from datetime import date
 from decimal import ROUND_HALF_UP, Decimal
+from itertools import groupby
+from operator import attrgetter
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
@@ -93,9 +95,8 @@ def _get_entry_map(
     if not cost_element_ids:
         return {}
 
-    # Query all entries for the cost elements where completion_date <= control_date
-    # We'll need to use a window function or subquery to get the latest per cost element
-    # For simplicity, we'll query all and filter in Python (acceptable for reasonable number of entries)
+    # Query all entries for the cost elements where completion_date <= control_date,
+    # sorted so the most recent entry comes first within each cost element
     statement = select(EarnedValueEntry).where(
         EarnedValueEntry.cost_element_id.in_(cost_element_ids),  # type: ignore[attr-defined]
     )
@@ -108,16 +109,12 @@ def _get_entry_map(
     )
     entries = session.exec(statement).all()
 
-    # Build map, keeping only the first (most recent) entry for each cost element
-    entry_map: dict[uuid.UUID, EarnedValueEntry | None] = {}
-    for entry in entries:
-        if entry.cost_element_id not in entry_map:
-            entry_map[entry.cost_element_id] = entry
-
-    # Ensure all cost_element_ids are in the map (with None if no entry)
-    for cost_element_id in cost_element_ids:
-        if cost_element_id not in entry_map:
-            entry_map[cost_element_id] = None
+    # Start every cost element at None, then take the head of each sorted group
+    entry_map: dict[uuid.UUID, EarnedValueEntry | None] = dict.fromkeys(
+        cost_element_ids
+    )
+    for cost_element_id, group in groupby(entries, key=attrgetter("cost_element_id")):
+        entry_map[cost_element_id] = next(group)
 
     return entry_map
 
@@ -13,12 +13,12 @@ from app.api.deps import (
     SessionDep,
     get_time_machine_control_date,
 )
+from app.api.routes.cost_registrations import _get_actual_cost_map
 from app.api.routes.earned_value import _get_entry_map, _get_forecast_eac_map
 from app.api.routes.planned_value import _get_schedule_map
 from app.models import (
     WBE,
     CostElement,
-    CostRegistration,
     EVMIndicesCostElementPublic,
     EVMIndicesProjectPublic,
     EVMIndicesWBEPublic,
@@ -28,11 +28,7 @@ from app.services.evm_aggregation import (
     aggregate_cost_element_metrics,
     get_cost_element_evm_metrics,
 )
-from app.services.time_machine import (
-    TimeMachineEventType,
-    apply_time_machine_filters,
-    end_of_day,
-)
+from app.services.time_machine import end_of_day
 
 router = APIRouter(prefix="/projects", tags=["evm-metrics"])
 
@@ -98,14 +94,8 @@ def get_cost_element_evm_metrics_endpoint(
     entry_map = _get_entry_map(session, [cost_element_id], control_date)
     entry = entry_map.get(cost_element_id)
 
-    # Get cost registrations
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id == cost_element_id,
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    cost_registrations = session.exec(statement).all()
+    # Get actual cost summed from cost registrations
+    actual_cost_map = _get_actual_cost_map(session, [cost_element_id], control_date)
 
     # Get current forecast EAC
     forecast_map = _get_forecast_eac_map(session, [cost_element_id], control_date)
@@ -116,7 +106,7 @@ def get_cost_element_evm_metrics_endpoint(
         cost_element=cost_element,
         schedule=schedule,
         entry=entry,
-        cost_registrations=cost_registrations,
+        actual_cost=actual_cost_map[cost_element_id],
         control_date=control_date,
         forecast_eac=forecast_eac,
     )
@@ -197,21 +187,8 @@ def get_wbe_evm_metrics_endpoint(
     # Get forecast EAC map
     forecast_map = _get_forecast_eac_map(session, cost_element_ids, control_date)
 
-    # Get cost registrations
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
+    # Get actual costs summed per cost element
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
 
     # Calculate metrics for each cost element
     cost_element_metrics = []
@@ -221,9 +198,7 @@ def get_wbe_evm_metrics_endpoint(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
             control_date=control_date,
             forecast_eac=forecast_eac,
         )
@@ -336,21 +311,8 @@ def get_project_evm_metrics_endpoint(
     # Get forecast EAC map
     forecast_map = _get_forecast_eac_map(session, cost_element_ids, control_date)
 
-    # Get cost registrations
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
+    # Get actual costs summed per cost element
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
 
     # Calculate metrics for each cost element
     cost_element_metrics = []
@@ -360,9 +322,7 @@ def get_project_evm_metrics_endpoint(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
             control_date=control_date,
             forecast_eac=forecast_eac,
         )
@@ -13,6 +13,7 @@ from app.api.deps import (
     SessionDep,
     get_time_machine_control_date,
 )
+from app.api.routes.cost_registrations import _get_actual_cost_map
 from app.api.routes.earned_value import (
     _get_entry_map,
 )
@@ -22,7 +23,6 @@ from app.api.routes.planned_value import (
 from app.models import (
     WBE,
     CostElement,
-    CostRegistration,
     EVMIndicesProjectPublic,
     EVMIndicesWBEPublic,
     Project,
@@ -38,11 +38,7 @@ from app.services.evm_indices import (
     calculate_spi,
     calculate_tcpi,
 )
-from app.services.time_machine import (
-    TimeMachineEventType,
-    apply_time_machine_filters,
-    end_of_day,
-)
+from app.services.time_machine import end_of_day
 
 router = APIRouter(prefix="/projects", tags=["evm-indices"])
 
@@ -89,24 +85,11 @@ def _get_wbe_evm_inputs(
 
     cost_element_ids = [ce.cost_element_id for ce in cost_elements]
 
-    # Get schedules, entries, and cost registrations
+    # Get schedules, entries, and actual costs
     schedule_map = _get_schedule_map(session, cost_element_ids, control_date)
     entry_map = _get_entry_map(session, cost_element_ids, control_date)
 
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
 
     # Calculate metrics for each cost element using unified service
     cost_element_metrics = []
@@ -115,9 +98,7 @@ def _get_wbe_evm_inputs(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
             control_date=control_date,
         )
         cost_element_metrics.append(metrics)
@@ -170,24 +151,11 @@ def _get_project_evm_inputs(
 
     cost_element_ids = [ce.cost_element_id for ce in cost_elements]
 
-    # Get schedules, entries, and cost registrations
+    # Get schedules, entries, and actual costs
     schedule_map = _get_schedule_map(session, cost_element_ids, control_date)
     entry_map = _get_entry_map(session, cost_element_ids, control_date)
 
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
 
     # Calculate metrics for each cost element using unified service
     cost_element_metrics = []
@@ -196,9 +164,7 @@ def _get_project_evm_inputs(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
             control_date=control_date,
         )
         cost_element_metrics.append(metrics)
@@ -21,6 +21,7 @@ from app.services.entity_versioning import (
     soft_delete_entity,
     update_entity_with_version,
 )
+from app.services.variance_analysis_report import clear_variance_threshold_cache
 
 router = APIRouter(prefix="/variance-threshold-configs", tags=["admin"])
 
@@ -118,6 +119,7 @@ def create_variance_threshold_config(
         entity_id=str(config.variance_threshold_config_id),
     )
     session.commit()
+    clear_variance_threshold_cache()
     session.refresh(config)
 
     return config
@@ -171,6 +173,7 @@ def update_variance_threshold_config(
         entity_type="variance_threshold_config",
     )
     session.commit()
+    clear_variance_threshold_cache()
     session.refresh(config)
 
     return config
@@ -191,5 +194,6 @@ def delete_variance_threshold_config(
         entity_type="variance_threshold_config",
     )
     session.commit()
+    clear_variance_threshold_cache()
 
     return Message(message="Variance threshold configuration deleted successfully")
@@ -23,6 +23,9 @@ def get_entity_version_history(
     ),
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=1000),
+    include_data: bool = Query(
+        default=False, description="Include the full entity data of each version"
+    ),
 ) -> dict[str, Any]:
     """
     Get version history for an entity.
@@ -38,6 +41,7 @@ def get_entity_version_history(
             branch=branch,
             skip=skip,
             limit=limit,
+            include_data=include_data,
         )
         return {
             "entity_type": entity_type,
@@ -51,15 +51,15 @@ def validate_revenue_allocation_against_project_limit(
     if not project:
         raise HTTPException(status_code=400, detail="Project not found")
 
-    # Query all WBEs for this project (excluding the one being updated if specified)
-    statement = select(WBE).where(WBE.project_id == project_id)
+    # Sum revenue_allocation over the project's WBEs in the database (excluding
+    # the one being updated if specified) rather than loading every row
+    statement = select(
+        func.coalesce(func.sum(WBE.revenue_allocation), Decimal("0.00"))
+    ).where(WBE.project_id == project_id)
     if exclude_wbe_id:
         statement = statement.where(WBE.wbe_id != exclude_wbe_id)
 
-    wbes = session.exec(statement).all()
-
-    # Sum existing revenue_allocation values
-    total_revenue_allocation = sum(wbe.revenue_allocation for wbe in wbes)
+    total_revenue_allocation: Decimal = session.execute(statement).scalar_one()
 
     # Add new_revenue_allocation
     new_total = total_revenue_allocation + new_revenue_allocation
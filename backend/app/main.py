@@ -1,10 +1,12 @@
 import sentry_sdk
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.routing import APIRoute
 from starlette.middleware.cors import CORSMiddleware
 
 from app.api.main import api_router
 from app.core.config import settings
+from app.services.entity_versioning import ConcurrentModificationError
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
@@ -30,4 +32,13 @@ if settings.all_cors_origins:
         allow_headers=["*"],
     )
 
+
+@app.exception_handler(ConcurrentModificationError)
+async def concurrent_modification_handler(
+    _request: Request, exc: ConcurrentModificationError
+) -> JSONResponse:
+    """Report a lost optimistic version check as a conflict the client can retry."""
+    return JSONResponse(status_code=409, content={"detail": str(exc)})
+
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -5,7 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 
 from pydantic import ConfigDict
-from sqlalchemy import DECIMAL, Column, DateTime
+from sqlalchemy import DECIMAL, Column, DateTime, Index, desc
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.branch_version_mixin import BranchVersionMixin
@@ -57,6 +57,16 @@ class CostElementUpdate(SQLModel):
 class CostElement(CostElementBase, BranchVersionMixin, table=True):
     """Cost Element database model."""
 
+    __table_args__ = (
+        # Supports branch-scoped queries filtered by versioning status (e.g. merge)
+        Index("ix_costelement_branch_status", "branch", "status"),
+        # Covers latest-version lookups per entity and branch (version DESC)
+        Index("ix_costelement_ebv", "entity_id", "branch", desc("version")),
+        # Serves joins and lookups by parent WBE within a branch and status
+        # (e.g. WBE revenue validation, branch comparison)
+        Index("ix_costelement_wbe_branch_status", "wbe_id", "branch", "status"),
+    )
+
     cost_element_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     wbe_id: uuid.UUID = Field(foreign_key="wbe.wbe_id", nullable=False)
     cost_element_type_id: uuid.UUID = Field(
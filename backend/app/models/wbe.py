@@ -5,7 +5,7 @@ from datetime import date, datetime
 from decimal import Decimal
 
 from pydantic import ConfigDict
-from sqlalchemy import DECIMAL, Column, Date, DateTime
+from sqlalchemy import DECIMAL, Column, Date, DateTime, Index, desc
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.models.branch_version_mixin import BranchVersionMixin
@@ -55,6 +55,13 @@ class WBEUpdate(SQLModel):
 class WBE(WBEBase, BranchVersionMixin, table=True):
     """WBE database model."""
 
+    __table_args__ = (
+        # Supports branch-scoped queries filtered by versioning status (e.g. merge)
+        Index("ix_wbe_branch_status", "branch", "status"),
+        # Covers latest-version lookups per entity and branch (version DESC)
+        Index("ix_wbe_ebv", "entity_id", "branch", desc("version")),
+    )
+
     wbe_id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     project_id: uuid.UUID = Field(foreign_key="project.project_id", nullable=False)
     project: Project | None = Relationship()
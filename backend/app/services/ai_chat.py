@@ -1,6 +1,7 @@
 """AI chat service for generating project assessments."""
 
 import uuid
+from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from datetime import date
 from decimal import Decimal
@@ -142,10 +143,10 @@ def _collect_project_metrics(
     all_cost_registrations = session.exec(statement).all()
 
     # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
+    cost_registrations_by_ce: defaultdict[uuid.UUID, list[CostRegistration]] = (
+        defaultdict(list)
+    )
     for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
         cost_registrations_by_ce[cr.cost_element_id].append(cr)
 
     # Calculate metrics for each cost element
@@ -245,10 +246,10 @@ def _collect_wbe_metrics(
     all_cost_registrations = session.exec(statement).all()
 
     # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
+    cost_registrations_by_ce: defaultdict[uuid.UUID, list[CostRegistration]] = (
+        defaultdict(list)
+    )
     for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
         cost_registrations_by_ce[cr.cost_element_id].append(cr)
 
     # Calculate metrics for each cost element
@@ -6,12 +6,17 @@ can be merged into the main branch upon approval.
 """
 
 import uuid
+from datetime import datetime
+from typing import Any
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, insert, select, update
 
 from app.models import WBE, ChangeOrder, CostElement
 from app.services.version_service import VersionService
 
+# Versioning statuses of branch rows that are carried over on merge
+_MERGEABLE_STATUSES = frozenset({"active", "deleted"})
+
 
 class BranchService:
     """Service for managing change order branches."""
@@ -21,8 +26,12 @@ class BranchService:
     @staticmethod
     def _generate_short_id(change_order_id: uuid.UUID) -> str:
         """Generate a short identifier from change order ID."""
-        uuid_hex = str(change_order_id).replace("-", "")
-        return uuid_hex[:6]
+        return change_order_id.hex[:6]
+
+    @staticmethod
+    def _derive_branch_name(change_order_id: uuid.UUID) -> str:
+        """Derive the branch name for a change order ID (no database access)."""
+        return f"co-{BranchService._generate_short_id(change_order_id)}"
 
     @staticmethod
     def create_branch(session: Session, change_order_id: uuid.UUID) -> str:
@@ -31,8 +40,7 @@ class BranchService:
         if not change_order:
             raise ValueError(f"Change order {change_order_id} not found")
 
-        short_id = BranchService._generate_short_id(change_order_id)
-        return f"co-{short_id}"
+        return BranchService._derive_branch_name(change_order_id)
 
     @staticmethod
     def get_branch_for_change_order(
@@ -43,89 +51,141 @@ class BranchService:
         if not change_order:
             return None
 
-        short_id = BranchService._generate_short_id(change_order_id)
-        return f"co-{short_id}"
+        return BranchService._derive_branch_name(change_order_id)
 
     @staticmethod
     def list_branches_for_project(session: Session, project_id: uuid.UUID) -> list[str]:
         """List all branches for a project (derived from change orders)."""
-        change_orders = session.exec(
-            select(ChangeOrder).where(ChangeOrder.project_id == project_id)
-        ).all()
-
-        branches = []
-        for co in change_orders:
-            branch_name = BranchService.get_branch_for_change_order(
-                session, co.change_order_id
+        change_order_ids = session.exec(
+            select(ChangeOrder.change_order_id).where(
+                ChangeOrder.project_id == project_id
             )
-            if branch_name:
-                branches.append(branch_name)
+        ).all()
 
-        return branches
+        # Change orders were just loaded, so the branch name can be derived
+        # directly instead of re-fetching each one.
+        return [
+            BranchService._derive_branch_name(change_order_id)
+            for change_order_id in change_order_ids
+        ]
 
     @staticmethod
-    def _create_wbe_version(
+    def _claim_next_version(
         session: Session,
+        entity_type: str,
+        entity_id: uuid.UUID,
+        target_branch: str,
+        claimed_versions: dict[uuid.UUID, int],
+    ) -> int:
+        """Reserve the next version number for an entity in the target branch.
+
+        Rows built during a merge are bulk-inserted at the end, so versions
+        already handed out are tracked in ``claimed_versions`` rather than
+        re-read from the database.
+        """
+        next_version = claimed_versions.get(entity_id)
+        if next_version is None:
+            next_version = VersionService.get_next_version(
+                session=session,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                branch=target_branch,
+            )
+        claimed_versions[entity_id] = next_version + 1
+        return next_version
+
+    @staticmethod
+    def _wbe_insert_row(
         source: WBE,
         target_branch: str,
+        version: int,
         status: str | None = None,
-    ) -> WBE:
-        """Create a new WBE version in the target branch based on source data."""
-        next_version = VersionService.get_next_version(
-            session=session,
-            entity_type="wbe",
-            entity_id=source.entity_id,
-            branch=target_branch,
-        )
-        new_wbe = WBE(
-            entity_id=source.entity_id,
-            project_id=source.project_id,
-            machine_type=source.machine_type,
-            serial_number=source.serial_number,
-            contracted_delivery_date=source.contracted_delivery_date,
-            revenue_allocation=source.revenue_allocation,
-            business_status=source.business_status,
-            notes=source.notes,
-            branch=target_branch,
-            version=next_version,
-            status=status or source.status,
-        )
-        session.add(new_wbe)
-        session.flush()
-        return new_wbe
+    ) -> dict[str, Any]:
+        """Build the insert mapping for a new WBE version in the target branch."""
+        now = datetime.utcnow()
+        return {
+            "wbe_id": uuid.uuid4(),
+            "entity_id": source.entity_id,
+            "project_id": source.project_id,
+            "machine_type": source.machine_type,
+            "serial_number": source.serial_number,
+            "contracted_delivery_date": source.contracted_delivery_date,
+            "revenue_allocation": source.revenue_allocation,
+            "business_status": source.business_status,
+            "notes": source.notes,
+            "branch": target_branch,
+            "version": version,
+            "status": status or source.status,
+            "created_at": now,
+            "updated_at": now,
+        }
 
     @staticmethod
-    def _create_cost_element_version(
-        session: Session,
+    def _cost_element_insert_row(
         source: CostElement,
         target_wbe_id: uuid.UUID,
         target_branch: str,
+        version: int,
         status: str | None = None,
-    ) -> CostElement:
-        """Create a new CostElement version in the target branch."""
-        next_version = VersionService.get_next_version(
-            session=session,
-            entity_type="costelement",
-            entity_id=source.entity_id,
-            branch=target_branch,
+    ) -> dict[str, Any]:
+        """Build the insert mapping for a new CostElement version in the target branch."""
+        now = datetime.utcnow()
+        return {
+            "cost_element_id": uuid.uuid4(),
+            "entity_id": source.entity_id,
+            "wbe_id": target_wbe_id,
+            "cost_element_type_id": source.cost_element_type_id,
+            "department_code": source.department_code,
+            "department_name": source.department_name,
+            "budget_bac": source.budget_bac,
+            "revenue_plan": source.revenue_plan,
+            "business_status": source.business_status,
+            "notes": source.notes,
+            "branch": target_branch,
+            "version": version,
+            "status": status or source.status,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    @staticmethod
+    def _get_wbes_by_id(
+        session: Session, wbe_ids: set[uuid.UUID]
+    ) -> dict[uuid.UUID, WBE]:
+        """Load WBE rows by primary key in a single query."""
+        if not wbe_ids:
+            return {}
+
+        wbes = session.exec(
+            select(WBE).where(WBE.wbe_id.in_(wbe_ids))  # type: ignore[attr-defined]
+        ).all()
+        return {wbe.wbe_id: wbe for wbe in wbes}
+
+    @staticmethod
+    def _get_latest_wbe_ids(
+        session: Session,
+        entity_ids: set[uuid.UUID],
+        branch: str,
+    ) -> dict[uuid.UUID, uuid.UUID]:
+        """Map each WBE entity_id to the wbe_id of its latest version in a branch."""
+        if not entity_ids:
+            return {}
+
+        latest_rank = (
+            func.row_number()
+            .over(partition_by=WBE.entity_id, order_by=WBE.version.desc())  # type: ignore[arg-type, attr-defined]
+            .label("latest_rank")
         )
-        new_cost_element = CostElement(
-            entity_id=source.entity_id,
-            wbe_id=target_wbe_id,
-            cost_element_type_id=source.cost_element_type_id,
-            department_code=source.department_code,
-            department_name=source.department_name,
-            budget_bac=source.budget_bac,
-            revenue_plan=source.revenue_plan,
-            business_status=source.business_status,
-            notes=source.notes,
-            branch=target_branch,
-            version=next_version,
-            status=status or source.status,
+        ranked = (
+            select(WBE.entity_id, WBE.wbe_id, latest_rank)
+            .where(WBE.branch == branch)
+            .where(WBE.entity_id.in_(entity_ids))  # type: ignore[attr-defined]
+            .subquery()
         )
-        session.add(new_cost_element)
-        session.flush()
-        return new_cost_element
+        rows = session.exec(
+            select(ranked.c.entity_id, ranked.c.wbe_id).where(ranked.c.latest_rank == 1)
+        ).all()
+        return dict(rows)
 
     @staticmethod
     def merge_branch(
@@ -138,72 +198,126 @@ class BranchService:
             raise ValueError("Cannot merge the main branch into itself.")
 
         if change_order_id:
-            expected_branch = BranchService.get_branch_for_change_order(
-                session, change_order_id
-            )
-            if expected_branch and expected_branch != branch:
+            expected_branch = BranchService._derive_branch_name(change_order_id)
+            if expected_branch != branch:
                 raise ValueError(
                     f"Branch '{branch}' does not match change order {change_order_id}"
                 )
 
         target_branch = BranchService.MAIN_BRANCH
         wbe_id_map: dict[uuid.UUID, uuid.UUID] = {}
-
-        branch_wbes = session.exec(select(WBE).where(WBE.branch == branch)).all()
+        wbe_rows: list[dict[str, Any]] = []
+        cost_element_rows: list[dict[str, Any]] = []
+        claimed_wbe_versions: dict[uuid.UUID, int] = {}
+        claimed_cost_element_versions: dict[uuid.UUID, int] = {}
+
+        branch_wbes = session.exec(
+            select(WBE)
+            .where(WBE.branch == branch)
+            .where(WBE.status.in_(_MERGEABLE_STATUSES))  # type: ignore[attr-defined]
+        ).all()
 
         for wbe in branch_wbes:
-            if wbe.status not in {"active", "deleted"}:
-                continue
-            new_wbe = BranchService._create_wbe_version(
-                session=session,
+            wbe_row = BranchService._wbe_insert_row(
                 source=wbe,
                 target_branch=target_branch,
+                version=BranchService._claim_next_version(
+                    session, "wbe", wbe.entity_id, target_branch, claimed_wbe_versions
+                ),
                 status=wbe.status,
             )
-            wbe_id_map[wbe.entity_id] = new_wbe.wbe_id
-            wbe.status = "merged"
-            session.add(wbe)
+            wbe_rows.append(wbe_row)
+            wbe_id_map[wbe.entity_id] = wbe_row["wbe_id"]
 
         branch_cost_elements = session.exec(
-            select(CostElement).where(CostElement.branch == branch)
+            select(CostElement)
+            .where(CostElement.branch == branch)
+            .where(CostElement.status.in_(_MERGEABLE_STATUSES))  # type: ignore[attr-defined]
         ).all()
 
-        for cost_element in branch_cost_elements:
-            if cost_element.status not in {"active", "deleted"}:
-                continue
+        # Load every parent WBE in one query instead of a point lookup per
+        # cost element
+        source_wbes = BranchService._get_wbes_by_id(
+            session, {cost_element.wbe_id for cost_element in branch_cost_elements}
+        )
+
+        # Resolve the latest main-branch WBE for every parent the WBE pass did
+        # not merge in a single query, rather than one lookup per cost element
+        unmapped_entity_ids = {
+            source_wbe.entity_id
+            for source_wbe in source_wbes.values()
+            if source_wbe.entity_id not in wbe_id_map
+        }
+        latest_target_wbe_ids = BranchService._get_latest_wbe_ids(
+            session, unmapped_entity_ids, target_branch
+        )
 
-            source_wbe = session.get(WBE, cost_element.wbe_id)
+        merged_cost_element_ids: list[uuid.UUID] = []
+        for cost_element in branch_cost_elements:
+            source_wbe = source_wbes.get(cost_element.wbe_id)
             if not source_wbe:
                 continue
 
             target_wbe_id = wbe_id_map.get(source_wbe.entity_id)
             if target_wbe_id is None:
                 # Fallback to latest main-branch WBE or create one if missing
-                target_wbe = session.exec(
-                    select(WBE)
-                    .where(WBE.entity_id == source_wbe.entity_id)
-                    .where(WBE.branch == target_branch)
-                    .order_by(WBE.version.desc())
-                ).first()
-                if not target_wbe:
-                    target_wbe = BranchService._create_wbe_version(
-                        session=session,
+                target_wbe_id = latest_target_wbe_ids.get(source_wbe.entity_id)
+                if target_wbe_id is None:
+                    wbe_row = BranchService._wbe_insert_row(
                         source=source_wbe,
                         target_branch=target_branch,
+                        version=BranchService._claim_next_version(
+                            session,
+                            "wbe",
+                            source_wbe.entity_id,
+                            target_branch,
+                            claimed_wbe_versions,
+                        ),
                         status=source_wbe.status,
                     )
-                target_wbe_id = target_wbe.wbe_id
+                    wbe_rows.append(wbe_row)
+                    target_wbe_id = wbe_row["wbe_id"]
                 wbe_id_map[source_wbe.entity_id] = target_wbe_id
 
-            BranchService._create_cost_element_version(
-                session=session,
-                source=cost_element,
-                target_wbe_id=target_wbe_id,
-                target_branch=target_branch,
-                status=cost_element.status,
+            cost_element_rows.append(
+                BranchService._cost_element_insert_row(
+                    source=cost_element,
+                    target_wbe_id=target_wbe_id,
+                    target_branch=target_branch,
+                    version=BranchService._claim_next_version(
+                        session,
+                        "costelement",
+                        cost_element.entity_id,
+                        target_branch,
+                        claimed_cost_element_versions,
+                    ),
+                    status=cost_element.status,
+                )
+            )
+            merged_cost_element_ids.append(cost_element.cost_element_id)
+
+        # Write all new main-branch versions with one bulk INSERT per table,
+        # WBEs first so cost element foreign keys resolve
+        if wbe_rows:
+            session.execute(insert(WBE), wbe_rows)
+        if cost_element_rows:
+            session.execute(insert(CostElement), cost_element_rows)
+
+        # Mark the merged branch rows with one UPDATE per table instead of one
+        # per row on flush
+        if branch_wbes:
+            session.execute(
+                update(WBE)
+                .where(WBE.wbe_id.in_([wbe.wbe_id for wbe in branch_wbes]))  # type: ignore[attr-defined]
+                .values(status="merged")
             )
-            cost_element.status = "merged"
-            session.add(cost_element)
+        if merged_cost_element_ids:
+            session.execute(
+                update(CostElement)
+                .where(CostElement.cost_element_id.in_(merged_cost_element_ids))  # type: ignore[attr-defined]
+                .values(status="merged")
+            )
+        session.flush()
 
     @staticmethod
     def delete_branch(session: Session, branch: str) -> None:
@@ -223,16 +337,13 @@ class BranchService:
         if branch == BranchService.MAIN_BRANCH:
             raise ValueError("Cannot delete the main branch.")
 
-        # Get all WBEs in the branch (all versions, all statuses)
-        branch_wbes = session.exec(select(WBE).where(WBE.branch == branch)).all()
-        for wbe in branch_wbes:
-            wbe.status = "deleted"
-            session.add(wbe)
-
-        # Get all CostElements in the branch (all versions, all statuses)
-        branch_cost_elements = session.exec(
-            select(CostElement).where(CostElement.branch == branch)
-        ).all()
-        for cost_element in branch_cost_elements:
-            cost_element.status = "deleted"
-            session.add(cost_element)
+        # Mark all WBEs and CostElements in the branch (all versions, all
+        # statuses) with one UPDATE per table instead of loading every row
+        session.execute(
+            update(WBE).where(WBE.branch == branch).values(status="deleted")  # type: ignore[arg-type]
+        )
+        session.execute(
+            update(CostElement)
+            .where(CostElement.branch == branch)  # type: ignore[arg-type]
+            .values(status="deleted")
+        )
@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
 
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
+from app.api.routes.cost_registrations import _get_actual_cost_map
+from app.api.routes.earned_value import _get_entry_map
+from app.api.routes.planned_value import _get_schedule_map
 from app.models import (
     WBE,
     CostElement,
     CostElementSchedule,
-    CostElementType,
-    CostRegistration,
     EarnedValueEntry,
     Project,
 )
@@ -22,30 +26,20 @@ from app.models.cost_performance_report import (
     CostPerformanceReportRowPublic,
 )
 from app.models.evm_indices import EVMIndicesProjectPublic
-from app.services.evm_aggregation import get_cost_element_evm_metrics
-from app.services.time_machine import (
-    TimeMachineEventType,
-    apply_time_machine_filters,
-    end_of_day,
+from app.services.evm_aggregation import (
+    CostElementEVMMetrics,
+    get_cost_element_evm_metrics,
 )
+from app.services.evm_indices import (
+    calculate_cost_variance,
+    calculate_cpi,
+    calculate_schedule_variance,
+    calculate_spi,
+    calculate_tcpi,
+)
+from app.services.time_machine import end_of_day
 
-
-def _get_schedule_map(
-    session: Session, cost_element_ids: list[uuid.UUID], control_date: date
-) -> dict[uuid.UUID, CostElementSchedule | None]:
-    """Get schedule map for cost elements (reused from evm_aggregation)."""
-    from app.api.routes.evm_aggregation import _get_schedule_map as get_schedule_map
-
-    return get_schedule_map(session, cost_element_ids, control_date)
-
-
-def _get_entry_map(
-    session: Session, cost_element_ids: list[uuid.UUID], control_date: date
-) -> dict[uuid.UUID, EarnedValueEntry | None]:
-    """Get earned value entry map for cost elements (reused from evm_aggregation)."""
-    from app.api.routes.evm_aggregation import _get_entry_map as get_entry_map
-
-    return get_entry_map(session, cost_element_ids, control_date)
+_D_ZERO_2P = Decimal("0.00")
 
 
 def get_cost_performance_report(
@@ -66,54 +60,121 @@ def get_cost_performance_report(
     if not project:
         raise ValueError(f"Project {project_id} not found")
 
-    # Get all WBEs for project (respecting control date)
-    cutoff = end_of_day(control_date)
-    wbes = session.exec(
-        select(WBE).where(
-            WBE.project_id == project_id,
-            WBE.created_at <= cutoff,
-        )
-    ).all()
+    inputs = _load_report_inputs(session, project_id, control_date)
+
+    totals = _ReportTotals()
+    rows = list(_iter_report_rows(inputs, control_date, totals))
+
+    return CostPerformanceReportPublic.model_construct(
+        project_id=project.project_id,
+        project_name=project.project_name,
+        control_date=control_date,
+        rows=rows,
+        summary=_build_summary(project, control_date, totals),
+    )
+
+
+@dataclass(slots=True)
+class _ReportInputs:
+    """Everything loaded from the database to compute report rows."""
+
+    cost_element_rows: Sequence[tuple[CostElement, WBE]]
+    schedule_map: Mapping[uuid.UUID, CostElementSchedule | None]
+    entry_map: Mapping[uuid.UUID, EarnedValueEntry | None]
+    actual_cost_map: Mapping[uuid.UUID, Decimal]
+
+
+@dataclass(slots=True)
+class _ReportTotals:
+    """Project totals of PV, EV, AC and BAC over the report's cost elements."""
+
+    planned_value: Decimal = _D_ZERO_2P
+    earned_value: Decimal = _D_ZERO_2P
+    actual_cost: Decimal = _D_ZERO_2P
+    budget_bac: Decimal = _D_ZERO_2P
+
+    def add(self, metrics: CostElementEVMMetrics) -> None:
+        """Add the metrics of one cost element to the totals."""
+        self.planned_value += metrics.planned_value
+        self.earned_value += metrics.earned_value
+        self.actual_cost += metrics.actual_cost
+        self.budget_bac += metrics.budget_bac
+
+
+def iter_cost_performance_rows(
+    session: Session, project_id: uuid.UUID, control_date: date
+) -> Iterator[CostPerformanceReportRowPublic]:
+    """Iterate over the cost performance report rows of a project.
+
+    All database reads happen before this returns, so the iterator can be
+    consumed lazily (e.g. by a streaming response) without the session.
+    The project itself is not looked up; callers check that it exists.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+        control_date: Control date for time-machine filtering
+
+    Returns:
+        Iterator producing one CostPerformanceReportRowPublic per cost element.
+    """
+    inputs = _load_report_inputs(session, project_id, control_date)
+    return _iter_report_rows(inputs, control_date)
+
+
+def get_cost_performance_summary(
+    session: Session, project_id: uuid.UUID, control_date: date
+) -> EVMIndicesProjectPublic:
+    """Get the project summary of the cost performance report.
 
-    # Get all cost elements for project (respecting control date)
-    cost_elements = session.exec(
-        select(CostElement)
-        .join(WBE)
+    Companion of ``iter_cost_performance_rows``: the totals are computed from
+    the same inputs without building any report rows.
+
+    Args:
+        session: Database session
+        project_id: Project ID
+        control_date: Control date for time-machine filtering
+
+    Returns:
+        EVMIndicesProjectPublic with the project totals and indices.
+    """
+    project = session.get(Project, project_id)
+    if not project:
+        raise ValueError(f"Project {project_id} not found")
+
+    inputs = _load_report_inputs(session, project_id, control_date)
+
+    totals = _ReportTotals()
+    for _cost_element, _wbe, metrics in _iter_cost_element_metrics(
+        inputs, control_date
+    ):
+        totals.add(metrics)
+
+    return _build_summary(project, control_date, totals)
+
+
+def _load_report_inputs(
+    session: Session, project_id: uuid.UUID, control_date: date
+) -> _ReportInputs:
+    """Load cost elements and their schedules, entries and actual costs."""
+    # Get all cost elements for project together with their WBE (respecting control date)
+    cutoff = end_of_day(control_date)
+    cost_element_rows = session.exec(
+        select(CostElement, WBE)
+        .join(WBE, CostElement.wbe_id == WBE.wbe_id)  # type: ignore[arg-type]
+        .options(selectinload(CostElement.cost_element_type))  # type: ignore[arg-type]
         .where(
             WBE.project_id == project_id,
+            WBE.created_at <= cutoff,
             CostElement.created_at <= cutoff,
         )
     ).all()
 
-    if not cost_elements:
-        # Return empty report with zero summary
-        summary = EVMIndicesProjectPublic(
-            level="project",
-            control_date=control_date,
-            project_id=project.project_id,
-            planned_value=Decimal("0.00"),
-            earned_value=Decimal("0.00"),
-            actual_cost=Decimal("0.00"),
-            budget_bac=Decimal("0.00"),
-            cpi=None,
-            spi=None,
-            tcpi=None,
-            cost_variance=Decimal("0.00"),
-            schedule_variance=Decimal("0.00"),
-        )
-        return CostPerformanceReportPublic(
-            project_id=project.project_id,
-            project_name=project.project_name,
-            control_date=control_date,
-            rows=[],
-            summary=summary,
-        )
-
-    # Create WBE lookup map
-    wbe_map = {wbe.wbe_id: wbe for wbe in wbes}
+    if not cost_element_rows:
+        return _ReportInputs(cost_element_rows, {}, {}, {})
 
     # Get cost element IDs
-    cost_element_ids = [ce.cost_element_id for ce in cost_elements]
+    cost_element_ids = [ce.cost_element_id for ce, _wbe in cost_element_rows]
 
     # Get schedules
     schedule_map = _get_schedule_map(session, cost_element_ids, control_date)
@@ -121,69 +182,48 @@ def get_cost_performance_report(
     # Get earned value entries
     entry_map = _get_entry_map(session, cost_element_ids, control_date)
 
-    # Get cost registrations
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
-
-    # Get cost element types for metadata
-    cost_element_type_ids = {
-        ce.cost_element_type_id
-        for ce in cost_elements
-        if ce.cost_element_type_id is not None
-    }
-    cost_element_types = {}
-    if cost_element_type_ids:
-        cet_list = session.exec(
-            select(CostElementType).where(
-                CostElementType.cost_element_type_id.in_(cost_element_type_ids)
-            )
-        ).all()
-        cost_element_types = {cet.cost_element_type_id: cet for cet in cet_list}
-
-    # Calculate metrics for each cost element and build rows
-    rows = []
-    total_pv = Decimal("0.00")
-    total_ev = Decimal("0.00")
-    total_ac = Decimal("0.00")
-    total_bac = Decimal("0.00")
-
-    for cost_element in cost_elements:
-        wbe = wbe_map.get(cost_element.wbe_id)
-        if not wbe:
-            continue  # Skip if WBE not found (shouldn't happen)
-
-        # Get EVM metrics
+    # Get actual costs, summed per cost element in the database
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
+
+    return _ReportInputs(cost_element_rows, schedule_map, entry_map, actual_cost_map)
+
+
+def _iter_cost_element_metrics(
+    inputs: _ReportInputs, control_date: date
+) -> Iterator[tuple[CostElement, WBE, CostElementEVMMetrics]]:
+    """Calculate the EVM metrics of each loaded cost element."""
+    schedule_map = inputs.schedule_map
+    entry_map = inputs.entry_map
+    actual_cost_map = inputs.actual_cost_map
+
+    for cost_element, wbe in inputs.cost_element_rows:
         metrics = get_cost_element_evm_metrics(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
             control_date=control_date,
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
         )
-
-        # Get cost element type name
-        cost_element_type_name = None
-        if cost_element.cost_element_type_id:
-            cet = cost_element_types.get(cost_element.cost_element_type_id)
-            if cet:
-                cost_element_type_name = cet.type_name
-
-        # Create row
-        row = CostPerformanceReportRowPublic(
+        yield cost_element, wbe, metrics
+
+
+def _iter_report_rows(
+    inputs: _ReportInputs,
+    control_date: date,
+    totals: _ReportTotals | None = None,
+) -> Iterator[CostPerformanceReportRowPublic]:
+    """Yield one report row per cost element, adding to ``totals`` if given."""
+    for cost_element, wbe, metrics in _iter_cost_element_metrics(inputs, control_date):
+        if totals is not None:
+            totals.add(metrics)
+
+        # Get cost element type name (eager-loaded with the cost element)
+        cet = cost_element.cost_element_type
+        cost_element_type_name = cet.type_name if cet else None
+
+        # All values come from loaded models and the EVM helpers, so the row is
+        # built without re-running pydantic validation.
+        yield CostPerformanceReportRowPublic.model_construct(
             cost_element_id=cost_element.cost_element_id,
             wbe_id=wbe.wbe_id,
             wbe_name=wbe.machine_type,
@@ -202,30 +242,18 @@ def get_cost_performance_report(
             cost_variance=metrics.cost_variance,
             schedule_variance=metrics.schedule_variance,
         )
-        rows.append(row)
-
-        # Accumulate totals for summary
-        total_pv += metrics.planned_value
-        total_ev += metrics.earned_value
-        total_ac += metrics.actual_cost
-        total_bac += metrics.budget_bac
-
-    # Calculate project summary indices
-    from app.services.evm_indices import (
-        calculate_cost_variance,
-        calculate_cpi,
-        calculate_schedule_variance,
-        calculate_spi,
-        calculate_tcpi,
-    )
 
-    summary_cpi = calculate_cpi(total_ev, total_ac)
-    summary_spi = calculate_spi(total_ev, total_pv)
-    summary_tcpi = calculate_tcpi(total_bac, total_ev, total_ac)
-    summary_cv = calculate_cost_variance(total_ev, total_ac)
-    summary_sv = calculate_schedule_variance(total_ev, total_pv)
 
-    summary = EVMIndicesProjectPublic(
+def _build_summary(
+    project: Project, control_date: date, totals: _ReportTotals
+) -> EVMIndicesProjectPublic:
+    """Build the project summary (totals and indices) of the report."""
+    total_pv = totals.planned_value
+    total_ev = totals.earned_value
+    total_ac = totals.actual_cost
+    total_bac = totals.budget_bac
+
+    return EVMIndicesProjectPublic.model_construct(
         level="project",
         control_date=control_date,
         project_id=project.project_id,
@@ -233,17 +261,9 @@ def get_cost_performance_report(
         earned_value=total_ev,
         actual_cost=total_ac,
         budget_bac=total_bac,
-        cpi=summary_cpi,
-        spi=summary_spi,
-        tcpi=summary_tcpi,
-        cost_variance=summary_cv,
-        schedule_variance=summary_sv,
-    )
-
-    return CostPerformanceReportPublic(
-        project_id=project.project_id,
-        project_name=project.project_name,
-        control_date=control_date,
-        rows=rows,
-        summary=summary,
+        cpi=calculate_cpi(total_ev, total_ac),
+        spi=calculate_spi(total_ev, total_pv),
+        tcpi=calculate_tcpi(total_bac, total_ev, total_ac),
+        cost_variance=calculate_cost_variance(total_ev, total_ac),
+        schedule_variance=calculate_schedule_variance(total_ev, total_pv),
     )
@@ -8,6 +8,9 @@ from decimal import ROUND_HALF_UP, Decimal
 TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
 ZERO = Decimal("0.0")
+ZERO_2P = Decimal("0.00")
+ZERO_4P = Decimal("0.0000")
+ONE_4P = Decimal("1.0000")
 
 
 def _quantize(value: Decimal, exp: Decimal) -> Decimal:
@@ -34,7 +37,7 @@ def calculate_cost_element_eac(
     if budget_bac is not None and budget_bac > ZERO:
         return _quantize(budget_bac, TWO_PLACES)
 
-    return Decimal("0.00")
+    return ZERO_2P
 
 
 def calculate_forecasted_quality(
@@ -53,12 +56,12 @@ def calculate_forecasted_quality(
         - 0.0000 if calculated_eac is zero
     """
     if calculated_eac == ZERO:
-        return Decimal("0.0000")
+        return ZERO_4P
 
     if forecast_eac is not None:
-        return Decimal("1.0000")
+        return ONE_4P
 
-    return Decimal("0.0000")
+    return ZERO_4P
 
 
 def aggregate_eac(eac_values: Iterable[Decimal]) -> Decimal:
@@ -71,7 +74,7 @@ def aggregate_eac(eac_values: Iterable[Decimal]) -> Decimal:
         Sum of all EAC values, quantized to 2 decimal places.
         Returns Decimal("0.00") if empty.
     """
-    total = sum(eac_values, start=Decimal("0.00"))
+    total = sum(eac_values, start=ZERO_2P)
     return _quantize(total, TWO_PLACES)
 
 
@@ -90,7 +93,7 @@ def aggregate_forecasted_quality(
         Returns Decimal("0.0000") if total_eac is zero.
     """
     if total_eac == ZERO:
-        return Decimal("0.0000")
+        return ZERO_4P
 
     quality = forecast_eac_sum / total_eac
     return _quantize(quality, FOUR_PLACES)
@@ -14,6 +14,8 @@ TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
 ONE = Decimal("1.0")
 ZERO = Decimal("0.0")
+ZERO_2P = Decimal("0.00")
+ZERO_4P = Decimal("0.0000")
 
 
 class EarnedValueError(Exception):
@@ -39,27 +41,20 @@ def _select_latest_entry_for_control_date(
         Tie-breaking: If multiple entries have the same completion_date, selects the one with
         the latest created_at timestamp.
     """
-    if not entries:
-        return None
-
-    # Filter entries where completion_date <= control_date
+    # Single pass over entries where completion_date <= control_date, keeping
+    # the one with the latest (completion_date, created_at)
     cutoff = end_of_day(control_date)
-    valid_entries = [
-        entry
-        for entry in entries
-        if entry.completion_date <= control_date
-        and entry.registration_date <= control_date
-        and entry.created_at <= cutoff
-    ]
-
-    if not valid_entries:
-        return None
-
-    # Sort by completion_date DESC, then created_at DESC
-    # This ensures we get the most recent entry
-    valid_entries.sort(key=lambda e: (e.completion_date, e.created_at), reverse=True)
-
-    return valid_entries[0]
+    return max(
+        (
+            entry
+            for entry in entries
+            if entry.completion_date <= control_date
+            and entry.registration_date <= control_date
+            and entry.created_at <= cutoff
+        ),
+        key=lambda e: (e.completion_date, e.created_at),
+        default=None,
+    )
 
 
 def calculate_earned_percent_complete(
@@ -75,9 +70,10 @@ def calculate_earned_percent_complete(
         Returns 0.0000 if entry is None.
     """
     if entry is None:
-        return _quantize(ZERO, FOUR_PLACES)
+        return ZERO_4P
 
-    percent_decimal = entry.percent_complete / Decimal("100")
+    # Shifting the exponent divides by 100 exactly without a Decimal division
+    percent_decimal = entry.percent_complete.scaleb(-2)
     return _quantize(percent_decimal, FOUR_PLACES)
 
 
@@ -95,8 +91,7 @@ def calculate_earned_value(
         Earned value (EV) as Decimal, quantized to 2 decimal places.
         Formula: EV = BAC × (percent_complete / 100)
     """
-    percent_decimal = percent_complete / Decimal("100")
-    earned_value = budget_bac * percent_decimal
+    earned_value = (budget_bac * percent_complete).scaleb(-2)
     return _quantize(earned_value, TWO_PLACES)
 
 
@@ -117,22 +112,28 @@ def calculate_cost_element_earned_value(
         Tuple of (earned_value: Decimal, percent_complete: Decimal).
         Returns (0.00, 0.0000) if entry is None.
     """
-    budget_bac = cost_element.budget_bac or Decimal("0.00")
+    budget_bac = cost_element.budget_bac or ZERO_2P
     if entry is None:
-        return Decimal("0.00"), Decimal("0.0000")
+        return ZERO_2P, ZERO_4P
 
     percent = calculate_earned_percent_complete(entry)
     earned_value = calculate_earned_value(budget_bac, entry.percent_complete)
     return earned_value, percent
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AggregateResult:
     earned_value: Decimal
     percent_complete: Decimal
     budget_bac: Decimal
 
 
+# Shared result for aggregates without budget or earned value (e.g. no entries)
+_EMPTY_AGGREGATE = AggregateResult(
+    earned_value=ZERO_2P, percent_complete=ZERO_4P, budget_bac=ZERO_2P
+)
+
+
 def aggregate_earned_value(
     values: Iterable[tuple[Decimal, Decimal]],
 ) -> AggregateResult:
@@ -145,18 +146,20 @@ def aggregate_earned_value(
         AggregateResult with total earned_value, weighted percent_complete, and total budget_bac.
         If total_bac is 0, returns percent_complete = 0.0000.
     """
-    total_bac = Decimal("0.00")
-    total_earned_value = Decimal("0.00")
+    total_bac = ZERO_2P
+    total_earned_value = ZERO_2P
 
     for earned_value, budget_bac in values:
         total_earned_value += earned_value
         total_bac += budget_bac
 
-    if total_bac == Decimal("0.00"):
+    if total_bac == ZERO_2P:
+        if total_earned_value == ZERO_2P:
+            return _EMPTY_AGGREGATE
         return AggregateResult(
             earned_value=_quantize(total_earned_value, TWO_PLACES),
-            percent_complete=Decimal("0.0000"),
-            budget_bac=Decimal("0.00"),
+            percent_complete=ZERO_4P,
+            budget_bac=ZERO_2P,
         )
 
     percent_complete = total_earned_value / total_bac
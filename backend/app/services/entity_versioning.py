@@ -5,22 +5,104 @@ entities with version tracking.
 """
 
 import uuid
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any, TypeVar
 
-from sqlmodel import Session, SQLModel, select
+from sqlalchemy import bindparam
+from sqlmodel import Session, SQLModel, delete, select, update
+from sqlmodel.sql.expression import SelectOfScalar
 
-from app.services.branch_filtering import apply_status_filters
+from app.models import BranchVersionMixin, ChangeOrder
+from app.services.branch_filtering import apply_branch_filters, apply_status_filters
 from app.services.version_service import VersionService
 
 T = TypeVar("T", bound=SQLModel)
 
 
+class ConcurrentModificationError(Exception):
+    """Raised when a row changed between being read and being updated in place."""
+
+
+# Primary key column name and mapped attribute per model class; table metadata
+# never changes at runtime
+_PK_INFO_CACHE: dict[type, tuple[str, Any]] = {}
+
+
+def _get_pk_info(entity_class: type) -> tuple[str, Any]:
+    """Return the (cached) primary key name and attribute of a table model class."""
+    pk_info = _PK_INFO_CACHE.get(entity_class)
+    if pk_info is None:
+        pk_column = next(iter(entity_class.__table__.primary_key.columns))  # type: ignore[attr-defined]
+        pk_info = _PK_INFO_CACHE[entity_class] = (
+            pk_column.name,
+            getattr(entity_class, pk_column.name),
+        )
+    return pk_info
+
+
+def _get_pk_field_name(entity_class: type) -> str:
+    """Return the (cached) primary key column name of a table model class."""
+    return _get_pk_info(entity_class)[0]
+
+
+# Versioning fields a model class defines, as bit flags cached per class
+_HAS_VERSION = 1
+_HAS_STATUS = 2
+_HAS_ENTITY_ID = 4
+_HAS_BRANCH = 8
+_CAPABILITY_FIELDS = (
+    ("version", _HAS_VERSION),
+    ("status", _HAS_STATUS),
+    ("entity_id", _HAS_ENTITY_ID),
+    ("branch", _HAS_BRANCH),
+)
+_CAPS: dict[type, int] = {}
+
+
+def _get_capabilities(entity_class: type[SQLModel]) -> int:
+    """Return the (cached) versioning field flags of a model class."""
+    caps = _CAPS.get(entity_class)
+    if caps is None:
+        model_fields = entity_class.model_fields
+        caps = _CAPS[entity_class] = sum(
+            flag for field, flag in _CAPABILITY_FIELDS if field in model_fields
+        )
+    return caps
+
+
+_NEW_VERSION_EXCLUDED_FIELDS = frozenset({"created_at", "updated_at"})
+
+
+def _new_version_field_values(entity: SQLModel, pk_field_name: str) -> dict[str, Any]:
+    """Read the field values to carry over into a new version of an entity.
+
+    Values are read straight from the instance instead of through
+    ``model_dump()``, which would serialize every field only for the
+    constructor to take them apart again. The primary key and timestamps are
+    left out so the new row gets fresh defaults.
+    """
+    return {
+        field: getattr(entity, field)
+        for field in entity.__class__.model_fields
+        if field != pk_field_name and field not in _NEW_VERSION_EXCLUDED_FIELDS
+    }
+
+
 def _resolve_identifier(
     entity: SQLModel, raw_identifier: str | uuid.UUID | None = None
 ) -> uuid.UUID:
     """Ensure entity has a stable identifier (entity_id)."""
-    pk_column = list(entity.__class__.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-    pk_field_name = pk_column.name
+    # Fast path: most entities already carry a UUID entity_id. Mapped
+    # attribute values live in the instance __dict__, so reading it directly
+    # skips the descriptor and the reflection below.
+    identifier = entity.__dict__.get("entity_id")
+    if identifier.__class__ is uuid.UUID:
+        return identifier
+
+    entity_class = entity.__class__
+    pk_field_name = _get_pk_field_name(entity_class)
     pk_value = getattr(entity, pk_field_name, None)
 
     identifier = getattr(entity, "entity_id", None) or raw_identifier or pk_value
@@ -28,17 +110,70 @@ def _resolve_identifier(
         identifier = uuid.uuid4()
     if not isinstance(identifier, uuid.UUID):
         identifier = uuid.UUID(str(identifier))
-    if hasattr(entity, "entity_id"):
+    if _get_capabilities(entity_class) & _HAS_ENTITY_ID:
         entity.entity_id = identifier
     return identifier
 
 
+# Next version per (entity_id, branch), prefetched for batches of CRUD calls
+VersionCache = dict[tuple[uuid.UUID, str | None], int]
+
+
+def _claim_next_version(
+    session: Session,
+    entity_type: str,
+    identifier: Any,
+    branch: str | None,
+    version_cache: VersionCache | None,
+) -> int:
+    """Return the next version of an entity, consulting ``version_cache`` first.
+
+    Versions handed out are recorded in the cache, so several calls for the
+    same entity in one batch keep incrementing without re-querying.
+    """
+    key = (identifier, branch)
+    next_version = version_cache.get(key) if version_cache is not None else None
+    if next_version is None:
+        next_version = VersionService.get_next_version(
+            session=session,
+            entity_type=entity_type,
+            entity_id=identifier,
+            branch=branch,
+        )
+    if version_cache is not None:
+        version_cache[key] = next_version + 1
+    return next_version
+
+
+def _prepare_new_entity(
+    entity: SQLModel, entity_id: str | None, branch: str | None
+) -> tuple[uuid.UUID, str | None]:
+    """Resolve the identifier and branch of an entity about to be created."""
+    identifier = _resolve_identifier(entity, entity_id)
+    branch_value: str | None = branch
+    if _get_versioning_impl(entity.__class__).is_branch_enabled:
+        branch_value = branch or getattr(entity, "branch", None) or "main"
+        if _get_capabilities(entity.__class__) & _HAS_BRANCH:
+            entity.branch = branch_value
+    return identifier, branch_value
+
+
+def _mark_created(entity: SQLModel, next_version: int) -> None:
+    """Set the version and active status on an entity about to be created."""
+    caps = _get_capabilities(entity.__class__)
+    if caps & _HAS_VERSION:
+        entity.version = next_version
+    if caps & _HAS_STATUS:
+        entity.status = "active"
+
+
 def create_entity_with_version(
     session: Session,
     entity: T,
     entity_type: str,
     entity_id: str | None = None,
     branch: str | None = None,
+    version_cache: VersionCache | None = None,
 ) -> T:
     """Create a new entity with version=1 and status='active'.
 
@@ -48,39 +183,159 @@ def create_entity_with_version(
         entity_type: Entity type name (e.g., 'project', 'user')
         entity_id: Entity ID (for version calculation, optional)
         branch: Branch name (only for branch-enabled entities)
+        version_cache: Optional prefetched next versions (see ``VersionCache``)
 
     Returns:
         Created entity with version and status set
     """
-    from app.models import BranchVersionMixin
+    identifier, branch_value = _prepare_new_entity(entity, entity_id, branch)
+    next_version = _claim_next_version(
+        session, entity_type, identifier, branch_value, version_cache
+    )
 
-    identifier = _resolve_identifier(entity, entity_id)
-    is_branch_enabled = isinstance(entity, BranchVersionMixin)
+    _mark_created(entity, next_version)
+    session.add(entity)
+    return entity
 
-    branch_value: str | None = branch
-    if is_branch_enabled:
-        branch_value = branch or getattr(entity, "branch", None) or "main"
-        if hasattr(entity, "branch"):
-            entity.branch = branch_value
 
-    if identifier is not None:
-        next_version = VersionService.get_next_version(
+def bulk_create_entities_with_version(
+    session: Session,
+    entities: list[T],
+    entity_type: str,
+    branch: str | None = None,
+) -> list[T]:
+    """Create several entities with version and status set.
+
+    Same semantics as ``create_entity_with_version``, but next versions are
+    resolved with one ``VersionService.get_next_versions_bulk`` query per
+    branch instead of one query per entity.
+
+    Args:
+        session: Database session
+        entities: Entity instances to create
+        entity_type: Entity type name (e.g., 'project', 'wbe')
+        branch: Branch name (only for branch-enabled entities)
+
+    Returns:
+        Created entities with version and status set
+    """
+    prepared = [_prepare_new_entity(entity, None, branch) for entity in entities]
+
+    identifiers_by_branch: defaultdict[str | None, set[uuid.UUID]] = defaultdict(set)
+    for identifier, branch_value in prepared:
+        identifiers_by_branch[branch_value].add(identifier)
+
+    version_cache: VersionCache = {}
+    for branch_value, identifiers in identifiers_by_branch.items():
+        next_versions = VersionService.get_next_versions_bulk(
             session=session,
             entity_type=entity_type,
-            entity_id=identifier,
+            entity_ids=identifiers,
             branch=branch_value,
         )
-    else:
-        next_version = 1
+        for identifier, next_version in next_versions.items():
+            version_cache[(identifier, branch_value)] = next_version
+
+    for entity, (identifier, branch_value) in zip(entities, prepared, strict=True):
+        _mark_created(
+            entity,
+            _claim_next_version(
+                session, entity_type, identifier, branch_value, version_cache
+            ),
+        )
 
-    # Set version and status
-    if hasattr(entity, "version"):
-        entity.version = next_version
-    if hasattr(entity, "status"):
-        entity.status = "active"
+    session.add_all(entities)
+    return entities
 
-    session.add(entity)
-    return entity
+
+@dataclass(slots=True, frozen=True)
+class _VersioningImpl:
+    """Versioning code paths of one model class, resolved on first use."""
+
+    is_branch_enabled: bool
+    write_update: Callable[..., Any]
+    write_delete: Callable[..., Any]
+
+
+_VERSIONING_IMPL: dict[type, _VersioningImpl] = {}
+
+
+def _get_versioning_impl(entity_class: type[SQLModel]) -> _VersioningImpl:
+    """Return the (cached) branch-aware or in-place versioning paths of a class."""
+    impl = _VERSIONING_IMPL.get(entity_class)
+    if impl is None:
+        if issubclass(entity_class, BranchVersionMixin):
+            impl = _VersioningImpl(
+                is_branch_enabled=True,
+                write_update=_update_as_new_version,
+                write_delete=_delete_as_new_version,
+            )
+        else:
+            impl = _VersioningImpl(
+                is_branch_enabled=False,
+                write_update=_update_in_place,
+                write_delete=_delete_in_place,
+            )
+        _VERSIONING_IMPL[entity_class] = impl
+    return impl
+
+
+def _scope_to_current(
+    statement: Any,
+    entity_class: type[T],
+    impl: _VersioningImpl,
+    branch: str | None,
+) -> Any:
+    """Apply status filter (or branch filter for branch-enabled entities)."""
+    if impl.is_branch_enabled:
+        return apply_branch_filters(statement, entity_class, branch=branch or "main")
+    return apply_status_filters(statement, entity_class)
+
+
+# Parameterized "current version by primary key" query per model class, built
+# once and executed with bound ``pk`` (and ``branch``) values
+_CURRENT_ENTITY_STATEMENTS: dict[type, Any] = {}
+
+
+def _get_current_entity_statement(entity_class: type[T], impl: _VersioningImpl) -> Any:
+    """Return the (cached) query loading the current version by primary key."""
+    statement = _CURRENT_ENTITY_STATEMENTS.get(entity_class)
+    if statement is None:
+        _pk_field_name, pk_field = _get_pk_info(entity_class)
+        statement = select(entity_class).where(pk_field == bindparam("pk"))
+        if impl.is_branch_enabled:
+            statement = apply_branch_filters(
+                statement,
+                entity_class,
+                branch=bindparam("branch"),  # type: ignore[arg-type]
+            )
+        else:
+            statement = apply_status_filters(statement, entity_class)
+        _CURRENT_ENTITY_STATEMENTS[entity_class] = statement
+    return statement
+
+
+def _get_current_entity(
+    session: Session,
+    entity_class: type[T],
+    entity_id: Any,
+    impl: _VersioningImpl,
+    branch: str | None,
+) -> T:
+    """Load the current version of an entity by primary key or raise ValueError."""
+    pk_field_name = _get_pk_field_name(entity_class)
+
+    params: dict[str, Any] = {"pk": entity_id}
+    if impl.is_branch_enabled:
+        params["branch"] = branch or "main"
+    current_entity: T | None = session.exec(
+        _get_current_entity_statement(entity_class, impl), params=params
+    ).first()
+    if not current_entity:
+        raise ValueError(
+            f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
+        )
+    return current_entity
 
 
 def update_entity_with_version(
@@ -90,6 +345,7 @@ def update_entity_with_version(
     update_data: dict[str, Any],
     entity_type: str,
     branch: str | None = None,
+    version_cache: VersionCache | None = None,
 ) -> T:
     """Update an entity by creating a new version.
 
@@ -105,72 +361,176 @@ def update_entity_with_version(
         update_data: Dictionary of fields to update
         entity_type: Entity type name (e.g., 'project', 'user')
         branch: Branch name (only for branch-enabled entities)
+        version_cache: Optional prefetched next versions (see ``VersionCache``)
 
     Returns:
         New version of the entity
     """
-    pk_column = list(entity_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-    pk_field_name = pk_column.name
-    pk_field = getattr(entity_class, pk_field_name)
+    impl = _get_versioning_impl(entity_class)
+    current_entity = _get_current_entity(session, entity_class, entity_id, impl, branch)
 
-    statement = select(entity_class).where(pk_field == entity_id)
+    identifier = getattr(current_entity, "entity_id", None) or entity_id
+    next_version = _claim_next_version(
+        session,
+        entity_type,
+        identifier,
+        branch if impl.is_branch_enabled else None,
+        version_cache,
+    )
 
-    # Apply status filter (or branch filter for branch-enabled entities)
-    from app.models import BranchVersionMixin
+    new_entity: T = impl.write_update(
+        session,
+        entity_class,
+        current_entity,
+        update_data,
+        identifier=identifier,
+        next_version=next_version,
+        branch=branch,
+    )
+    return new_entity
 
-    is_branch_enabled = issubclass(entity_class, BranchVersionMixin)
-    if is_branch_enabled:
-        from app.services.branch_filtering import apply_branch_filters
 
-        statement = apply_branch_filters(
-            statement, entity_class, branch=branch or "main"
-        )
-    else:
-        statement = apply_status_filters(statement, entity_class)
+def bulk_update_entities_with_version(
+    session: Session,
+    entity_class: type[T],
+    updates: dict[Any, dict[str, Any]],
+    entity_type: str,
+    branch: str | None = None,
+) -> list[T]:
+    """Update several entities of one class by creating a new version of each.
 
-    current_entity = session.exec(statement).first()
-    if not current_entity:
-        raise ValueError(
-            f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
-        )
+    Same semantics as ``update_entity_with_version``, but the current versions
+    are loaded with one query and the next version numbers are resolved with
+    one ``VersionService.get_next_versions_bulk`` call instead of per entity.
 
-    identifier = getattr(current_entity, "entity_id", None) or entity_id
-    next_version = VersionService.get_next_version(
+    Args:
+        session: Database session
+        entity_class: Entity model class
+        updates: Dictionary mapping entity ID (primary key) -> fields to update
+        entity_type: Entity type name (e.g., 'project', 'wbe')
+        branch: Branch name (only for branch-enabled entities)
+
+    Returns:
+        New versions of the entities, in the order of ``updates``
+    """
+    if not updates:
+        return []
+
+    impl = _get_versioning_impl(entity_class)
+    pk_field_name, pk_field = _get_pk_info(entity_class)
+
+    statement = _scope_to_current(
+        select(entity_class).where(pk_field.in_(list(updates))),
+        entity_class,
+        impl,
+        branch,
+    )
+    current_entities = {
+        getattr(entity, pk_field_name): entity
+        for entity in session.exec(statement).all()
+    }
+    for entity_id in updates:
+        if entity_id not in current_entities:
+            raise ValueError(
+                f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
+            )
+
+    identifiers = {
+        entity_id: getattr(current_entities[entity_id], "entity_id", None) or entity_id
+        for entity_id in updates
+    }
+    version_branch = branch if impl.is_branch_enabled else None
+    next_versions = VersionService.get_next_versions_bulk(
         session=session,
         entity_type=entity_type,
-        entity_id=identifier,
-        branch=branch if is_branch_enabled else None,
+        entity_ids=identifiers.values(),
+        branch=version_branch,
     )
+    # Claim versions through the cache so several primary keys resolving to
+    # the same entity_id (e.g. older branch versions still active) each get
+    # their own number
+    version_cache: VersionCache = {
+        (identifier, version_branch): next_version
+        for identifier, next_version in next_versions.items()
+    }
+
+    return [
+        impl.write_update(
+            session,
+            entity_class,
+            current_entities[entity_id],
+            update_data,
+            identifier=identifiers[entity_id],
+            next_version=_claim_next_version(
+                session,
+                entity_type,
+                identifiers[entity_id],
+                version_branch,
+                version_cache,
+            ),
+            branch=branch,
+        )
+        for entity_id, update_data in updates.items()
+    ]
 
-    if is_branch_enabled:
-        entity_data = current_entity.model_dump()
-        entity_data.update(update_data)
-        entity_data.pop(pk_field_name, None)
-        entity_data.pop("created_at", None)
-        entity_data.pop("updated_at", None)
-        entity_data["version"] = next_version
-        entity_data["status"] = "active"
-        if hasattr(entity_class, "entity_id"):
-            entity_data["entity_id"] = identifier
-        if hasattr(entity_class, "branch"):
-            entity_data["branch"] = branch or current_entity.branch  # type: ignore[attr-defined]
-
-        new_entity = entity_class(**entity_data)
-        session.add(new_entity)
-        return new_entity
-
-    # Non-branch entities are updated in-place
-    for key, value in update_data.items():
-        if key in {"entity_id", pk_field_name, "version"}:
-            continue
-        if hasattr(current_entity, key):
-            setattr(current_entity, key, value)
-    if hasattr(current_entity, "version"):
-        current_entity.version = next_version  # type: ignore[attr-defined]
-    if hasattr(current_entity, "status"):
-        current_entity.status = "active"  # type: ignore[attr-defined]
-
-    session.add(current_entity)
+
+def _update_as_new_version(
+    session: Session,
+    entity_class: type[T],
+    current_entity: T,
+    update_data: dict[str, Any],
+    *,
+    identifier: Any,
+    next_version: int,
+    branch: str | None,
+) -> T:
+    """Write ``update_data`` as a new row for a branch-enabled entity."""
+    pk_field_name = _get_pk_field_name(entity_class)
+    caps = _get_capabilities(entity_class)
+
+    entity_data = _new_version_field_values(current_entity, pk_field_name)
+    entity_data.update(update_data)
+    entity_data.pop(pk_field_name, None)
+    entity_data.pop("created_at", None)
+    entity_data.pop("updated_at", None)
+    entity_data["version"] = next_version
+    entity_data["status"] = "active"
+    if caps & _HAS_ENTITY_ID:
+        entity_data["entity_id"] = identifier
+    if caps & _HAS_BRANCH:
+        entity_data["branch"] = branch or current_entity.branch  # type: ignore[attr-defined]
+
+    new_entity = entity_class(**entity_data)
+    session.add(new_entity)
+    return new_entity
+
+
+def _update_in_place(
+    session: Session,
+    entity_class: type[T],
+    current_entity: T,
+    update_data: dict[str, Any],
+    *,
+    identifier: Any,  # noqa: ARG001
+    next_version: int,
+    branch: str | None,  # noqa: ARG001
+) -> T:
+    """Write ``update_data`` onto the current row of a non-branch entity."""
+    pk_field_name = _get_pk_field_name(entity_class)
+    caps = _get_capabilities(entity_class)
+    columns = entity_class.__table__.columns  # type: ignore[attr-defined]
+
+    values = {
+        key: value
+        for key, value in update_data.items()
+        if key not in {"entity_id", pk_field_name, "version"} and key in columns
+    }
+    if caps & _HAS_VERSION:
+        values["version"] = next_version
+    if caps & _HAS_STATUS:
+        values["status"] = "active"
+
+    _update_current_row(session, entity_class, current_entity, values)
     return current_entity
 
 
@@ -180,6 +540,7 @@ def soft_delete_entity(
     entity_id: Any,
     entity_type: str,
     branch: str | None = None,
+    version_cache: VersionCache | None = None,
 ) -> T:
     """Soft delete an entity by creating a new version with status='deleted'.
 
@@ -189,70 +550,128 @@ def soft_delete_entity(
         entity_id: Entity ID (primary key)
         entity_type: Entity type name (e.g., 'project', 'user')
         branch: Branch name (only for branch-enabled entities)
+        version_cache: Optional prefetched next versions (see ``VersionCache``)
 
     Returns:
         New version of the entity with status='deleted'
     """
-    pk_column = list(entity_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-    pk_field_name = pk_column.name
-    pk_field = getattr(entity_class, pk_field_name)
+    impl = _get_versioning_impl(entity_class)
+    current_entity = _get_current_entity(session, entity_class, entity_id, impl, branch)
 
-    # Get current active entity
-    statement = select(entity_class).where(pk_field == entity_id)
+    identifier = getattr(current_entity, "entity_id", None) or entity_id
+    next_version = _claim_next_version(
+        session,
+        entity_type,
+        identifier,
+        branch if impl.is_branch_enabled else None,
+        version_cache,
+    )
 
-    # Apply status filter (or branch filter for branch-enabled entities)
-    from app.models import BranchVersionMixin
+    deleted_entity: T = impl.write_delete(
+        session,
+        entity_class,
+        current_entity,
+        identifier=identifier,
+        next_version=next_version,
+        branch=branch,
+    )
+    return deleted_entity
 
-    is_branch_enabled = issubclass(entity_class, BranchVersionMixin)
-    if is_branch_enabled:
-        from app.services.branch_filtering import apply_branch_filters
 
-        statement = apply_branch_filters(
-            statement, entity_class, branch=branch or "main"
-        )
-    else:
-        statement = apply_status_filters(statement, entity_class)
+def _delete_as_new_version(
+    session: Session,
+    entity_class: type[T],
+    current_entity: T,
+    *,
+    identifier: Any,
+    next_version: int,
+    branch: str | None,
+) -> T:
+    """Write a new row with status='deleted' for a branch-enabled entity."""
+    pk_field_name = _get_pk_field_name(entity_class)
+    caps = _get_capabilities(entity_class)
 
-    current_entity = session.exec(statement).first()
-    if not current_entity:
-        raise ValueError(
-            f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
-        )
+    entity_data = _new_version_field_values(current_entity, pk_field_name)
+    entity_data["version"] = next_version
+    entity_data["status"] = "deleted"
+    if caps & _HAS_ENTITY_ID:
+        entity_data["entity_id"] = identifier
+    if caps & _HAS_BRANCH:
+        entity_data["branch"] = branch or current_entity.branch  # type: ignore[attr-defined]
 
-    identifier = getattr(current_entity, "entity_id", None) or entity_id
-    next_version = VersionService.get_next_version(
-        session=session,
-        entity_type=entity_type,
-        entity_id=identifier,
-        branch=branch if is_branch_enabled else None,
-    )
+    deleted_entity = entity_class(**entity_data)
+    session.add(deleted_entity)
+    return deleted_entity
 
-    if is_branch_enabled:
-        entity_data = current_entity.model_dump()
-        entity_data.pop(pk_field_name, None)
-        entity_data.pop("created_at", None)
-        entity_data.pop("updated_at", None)
-        entity_data["version"] = next_version
-        entity_data["status"] = "deleted"
-        if hasattr(entity_class, "entity_id"):
-            entity_data["entity_id"] = identifier
-        if hasattr(entity_class, "branch"):
-            entity_data["branch"] = branch or current_entity.branch  # type: ignore[attr-defined]
 
-        deleted_entity = entity_class(**entity_data)
-        session.add(deleted_entity)
-        return deleted_entity
+def _delete_in_place(
+    session: Session,
+    entity_class: type[T],
+    current_entity: T,
+    *,
+    identifier: Any,  # noqa: ARG001
+    next_version: int,
+    branch: str | None,  # noqa: ARG001
+) -> T:
+    """Mark the current row of a non-branch entity as deleted."""
+    caps = _get_capabilities(entity_class)
 
-    # Non-branch entities: update status in place
-    if hasattr(current_entity, "status"):
-        current_entity.status = "deleted"  # type: ignore[attr-defined]
-    if hasattr(current_entity, "version"):
-        current_entity.version = next_version  # type: ignore[attr-defined]
+    values: dict[str, Any] = {}
+    if caps & _HAS_STATUS:
+        values["status"] = "deleted"
+    if caps & _HAS_VERSION:
+        values["version"] = next_version
 
-    session.add(current_entity)
+    _update_current_row(session, entity_class, current_entity, values)
     return current_entity
 
 
+def _update_current_row(
+    session: Session,
+    entity_class: type[T],
+    current_entity: T,
+    values: dict[str, Any],
+) -> None:
+    """Write ``values`` to the row of ``current_entity`` with a single UPDATE.
+
+    For versioned entities the UPDATE only matches while the row still has the
+    version that was read, so a concurrent writer makes it affect no rows
+    instead of being silently overwritten. The loaded instance is synchronized
+    with the new values by the ORM.
+    """
+    if not values:
+        return
+
+    pk_field_name, pk_field = _get_pk_info(entity_class)
+    entity_id = getattr(current_entity, pk_field_name)
+    statement = update(entity_class).where(pk_field == entity_id)
+    if _get_capabilities(entity_class) & _HAS_VERSION:
+        statement = statement.where(
+            entity_class.version == current_entity.version  # type: ignore[attr-defined]
+        )
+
+    result = session.execute(statement.values(**values))
+    if result.rowcount == 0:  # type: ignore[attr-defined]
+        raise ConcurrentModificationError(
+            f"{entity_class.__name__} with {pk_field_name}={entity_id} "
+            "was modified concurrently"
+        )
+
+
+def _latest_branch_version_statement(
+    entity_class: type[T], pk_field: Any, entity_id: Any, branch: str
+) -> SelectOfScalar[T]:
+    """Select the latest version in ``branch`` of the entity owning a primary key."""
+    identifier = select(entity_class.entity_id).where(pk_field == entity_id)  # type: ignore[attr-defined]
+    return (
+        select(entity_class)
+        .where(entity_class.entity_id == identifier.scalar_subquery())  # type: ignore[attr-defined]
+        .where(entity_class.branch == branch)  # type: ignore[attr-defined]
+        .order_by(entity_class.version.desc())  # type: ignore[attr-defined]
+        .limit(1)
+    )
+
+
 def restore_entity(
     session: Session,
     entity_class: type[T],
@@ -275,49 +694,27 @@ def restore_entity(
     Raises:
         ValueError: If entity not found or not deleted
     """
-    pk_column = list(entity_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-    pk_field_name = pk_column.name
-    pk_field = getattr(entity_class, pk_field_name)
+    pk_field_name, pk_field = _get_pk_info(entity_class)
 
     # For branch-enabled entities, we need to find by entity_id, not primary key
     # because soft delete creates a new version with a new primary key
-    from app.models import BranchVersionMixin
-
-    is_branch_enabled = issubclass(entity_class, BranchVersionMixin)
+    is_branch_enabled = _get_versioning_impl(entity_class).is_branch_enabled
 
     if is_branch_enabled:
-        branch_value = branch or "main"
-        # First, find any version by primary key to get entity_id
-        any_version = session.exec(
-            select(entity_class).where(pk_field == entity_id)
-        ).first()
-
-        if not any_version:
-            raise ValueError(
-                f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
-            )
-
-        # Get entity_id from the found version
-        identifier = getattr(any_version, "entity_id", None)
-        if not identifier:
-            raise ValueError(
-                f"{entity_class.__name__} with {pk_field_name}={entity_id} has no entity_id"
+        # Find the latest version in the branch of the entity_id owning this
+        # primary key, resolving the entity_id in a subquery
+        deleted_entity = session.exec(
+            _latest_branch_version_statement(
+                entity_class, pk_field, entity_id, branch or "main"
             )
-
-        # Query by entity_id and branch to find deleted version
-        statement = (
-            select(entity_class)
-            .where(entity_class.entity_id == identifier)  # type: ignore[attr-defined]
-            .where(entity_class.branch == branch_value)  # type: ignore[attr-defined]
-            .order_by(entity_class.version.desc())  # type: ignore[attr-defined]
-        )
-        deleted_entity = session.exec(statement).first()
+        ).first()
     else:
         # For non-branch entities, query by primary key
         statement = (
             select(entity_class)
             .where(pk_field == entity_id)
             .order_by(entity_class.version.desc())  # type: ignore[attr-defined]
+            .limit(1)
         )
         deleted_entity = session.exec(statement).first()
 
@@ -327,7 +724,8 @@ def restore_entity(
         )
 
     # Check if it's actually deleted
-    if hasattr(deleted_entity, "status") and deleted_entity.status != "deleted":  # type: ignore[attr-defined]
+    caps = _get_capabilities(entity_class)
+    if caps & _HAS_STATUS and deleted_entity.status != "deleted":  # type: ignore[attr-defined]
         raise ValueError(
             f"{entity_class.__name__} with {pk_field_name}={entity_id} is not deleted"
         )
@@ -343,8 +741,6 @@ def restore_entity(
     # For ChangeOrder, check if there's already an active version with the same change_order_number
     # This is needed because change_order_number has a unique constraint
     if entity_class.__name__ == "ChangeOrder":
-        from app.models import ChangeOrder
-
         change_order_number = getattr(deleted_entity, "change_order_number", None)
         if change_order_number:
             active_co = session.exec(
@@ -365,9 +761,9 @@ def restore_entity(
         entity_data.pop("updated_at", None)
         entity_data["version"] = next_version
         entity_data["status"] = "active"
-        if hasattr(entity_class, "entity_id"):
+        if caps & _HAS_ENTITY_ID:
             entity_data["entity_id"] = identifier
-        if hasattr(entity_class, "branch"):
+        if caps & _HAS_BRANCH:
             entity_data["branch"] = branch or deleted_entity.branch  # type: ignore[attr-defined]
 
         restored_entity = entity_class(**entity_data)
@@ -381,7 +777,7 @@ def restore_entity(
     entity_data.pop("updated_at", None)
     entity_data["version"] = next_version
     entity_data["status"] = "active"
-    if hasattr(entity_class, "entity_id"):
+    if caps & _HAS_ENTITY_ID:
         entity_data["entity_id"] = identifier
 
     restored_entity = entity_class(**entity_data)
@@ -411,69 +807,49 @@ def hard_delete_entity(
     Raises:
         ValueError: If entity not found or not deleted
     """
-    pk_column = list(entity_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-    pk_field_name = pk_column.name
-    pk_field = getattr(entity_class, pk_field_name)
+    pk_field_name, pk_field = _get_pk_info(entity_class)
 
-    # For branch-enabled entities, we need to find by entity_id
-    from app.models import BranchVersionMixin
+    caps = _get_capabilities(entity_class)
 
-    is_branch_enabled = issubclass(entity_class, BranchVersionMixin)
+    # For branch-enabled entities, we need to find by entity_id
+    is_branch_enabled = _get_versioning_impl(entity_class).is_branch_enabled
 
     if is_branch_enabled:
         branch_value = branch or "main"
-        # First, find any version by primary key to get entity_id
-        any_version = session.exec(
-            select(entity_class).where(pk_field == entity_id)
-        ).first()
-
-        if not any_version:
-            raise ValueError(
-                f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
+        # Verify the latest version (of the entity_id owning this primary key)
+        # is deleted
+        latest_version = session.exec(
+            _latest_branch_version_statement(
+                entity_class, pk_field, entity_id, branch_value
             )
-
-        # Get entity_id from the found version
-        identifier = getattr(any_version, "entity_id", None)
-        if not identifier:
-            raise ValueError(
-                f"{entity_class.__name__} with {pk_field_name}={entity_id} has no entity_id"
-            )
-
-        # Verify at least one version is deleted
-        statement = (
-            select(entity_class)
-            .where(entity_class.entity_id == identifier)  # type: ignore[attr-defined]
-            .where(entity_class.branch == branch_value)  # type: ignore[attr-defined]
-            .order_by(entity_class.version.desc())  # type: ignore[attr-defined]
-        )
-        latest_version = session.exec(statement).first()
+        ).first()
 
         if not latest_version:
             raise ValueError(
                 f"{entity_class.__name__} with {pk_field_name}={entity_id} not found"
             )
 
-        if hasattr(latest_version, "status") and latest_version.status != "deleted":  # type: ignore[attr-defined]
+        if caps & _HAS_STATUS and latest_version.status != "deleted":  # type: ignore[attr-defined]
             raise ValueError(
                 f"{entity_class.__name__} with {pk_field_name}={entity_id} is not deleted. "
                 "Hard delete can only be performed on soft-deleted entities."
             )
 
-        # Delete all versions for this entity_id and branch
-        statement = (
-            select(entity_class)
+        identifier = latest_version.entity_id  # type: ignore[attr-defined]
+
+        # Delete all versions for this entity_id and branch in one statement
+        session.execute(
+            delete(entity_class)
             .where(entity_class.entity_id == identifier)  # type: ignore[attr-defined]
             .where(entity_class.branch == branch_value)  # type: ignore[attr-defined]
         )
-        all_versions = session.exec(statement).all()
-        for version in all_versions:
-            session.delete(version)
     else:
         # For non-branch entities, query by primary key
         statement = (
             select(entity_class)
             .where(pk_field == entity_id)
             .order_by(entity_class.version.desc())  # type: ignore[attr-defined]
+            .limit(1)
         )
         latest_version = session.exec(statement).first()
 
@@ -483,7 +859,7 @@ def hard_delete_entity(
             )
 
         # Verify it's deleted
-        if hasattr(latest_version, "status") and latest_version.status != "deleted":  # type: ignore[attr-defined]
+        if caps & _HAS_STATUS and latest_version.status != "deleted":  # type: ignore[attr-defined]
             raise ValueError(
                 f"{entity_class.__name__} with {pk_field_name}={entity_id} is not deleted. "
                 "Hard delete can only be performed on soft-deleted entities."
@@ -492,10 +868,9 @@ def hard_delete_entity(
         # Get entity_id to delete all versions
         identifier = getattr(latest_version, "entity_id", None) or entity_id
 
-        # Delete all versions for this entity_id
-        statement = select(entity_class).where(
-            entity_class.entity_id == identifier  # type: ignore[attr-defined]
+        # Delete all versions for this entity_id in one statement
+        session.execute(
+            delete(entity_class).where(
+                entity_class.entity_id == identifier  # type: ignore[attr-defined]
+            )
         )
-        all_versions = session.exec(statement).all()
-        for version in all_versions:
-            session.delete(version)
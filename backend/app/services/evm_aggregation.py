@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date
 from decimal import Decimal
@@ -20,36 +21,17 @@ from app.services.eac_calculation import (
     calculate_forecasted_quality,
 )
 from app.services.earned_value import calculate_cost_element_earned_value
-from app.services.evm_indices import (
-    calculate_cost_variance,
-    calculate_cpi,
-    calculate_schedule_variance,
-    calculate_spi,
-    calculate_tcpi,
-)
+from app.services.evm_indices import calculate_all_indices
 from app.services.planned_value import calculate_cost_element_planned_value
 
+ZERO_2P = Decimal("0.00")
+ZERO_4P = Decimal("0.0000")
+ONE_4P = Decimal("1.0000")
 
-@dataclass(slots=True)
-class WBEEVMMetrics:
-    """EVM metrics for a WBE (aggregated from cost elements)."""
-
-    planned_value: Decimal
-    earned_value: Decimal
-    actual_cost: Decimal
-    budget_bac: Decimal
-    eac: Decimal
-    forecasted_quality: Decimal
-    cpi: Decimal | None
-    spi: Decimal | None
-    tcpi: Decimal | Literal["overrun"] | None
-    cost_variance: Decimal
-    schedule_variance: Decimal
 
-
-@dataclass(slots=True)
-class ProjectEVMMetrics:
-    """EVM metrics for a project (aggregated from WBEs)."""
+@dataclass(slots=True, frozen=True)
+class EVMMetrics:
+    """EVM metrics for a cost element, or aggregated for a WBE or project."""
 
     planned_value: Decimal
     earned_value: Decimal
@@ -64,21 +46,25 @@ class ProjectEVMMetrics:
     schedule_variance: Decimal
 
 
-@dataclass(slots=True)
-class CostElementEVMMetrics:
-    """EVM metrics for a single cost element."""
-
-    planned_value: Decimal
-    earned_value: Decimal
-    actual_cost: Decimal
-    budget_bac: Decimal
-    eac: Decimal
-    forecasted_quality: Decimal
-    cpi: Decimal | None
-    spi: Decimal | None
-    tcpi: Decimal | Literal["overrun"] | None
-    cost_variance: Decimal
-    schedule_variance: Decimal
+# Level-specific names, kept for readability at call sites
+CostElementEVMMetrics = EVMMetrics
+WBEEVMMetrics = EVMMetrics
+ProjectEVMMetrics = EVMMetrics
+
+# Result of aggregating no cost elements; shared since EVMMetrics is frozen
+_EMPTY_METRICS = EVMMetrics(
+    planned_value=ZERO_2P,
+    earned_value=ZERO_2P,
+    actual_cost=ZERO_2P,
+    budget_bac=ZERO_2P,
+    eac=ZERO_2P,
+    forecasted_quality=ZERO_4P,
+    cpi=None,
+    spi=None,
+    tcpi=None,
+    cost_variance=ZERO_2P,
+    schedule_variance=ZERO_2P,
+)
 
 
 def get_cost_element_evm_metrics(
@@ -86,12 +72,15 @@ def get_cost_element_evm_metrics(
     cost_element: CostElement,
     schedule: CostElementSchedule | None,
     entry: EarnedValueEntry | None,
-    cost_registrations: list[CostRegistration],
+    cost_registrations: Sequence[CostRegistration] | None = None,
     control_date: date,
     forecast_eac: Decimal | None = None,
+    actual_cost: Decimal | None = None,
 ) -> CostElementEVMMetrics:
     """Get all EVM metrics for a single cost element by reusing existing services.
 
+    AC comes from exactly one of ``cost_registrations`` and ``actual_cost``.
+
     Args:
         cost_element: Cost element to calculate metrics for
         schedule: Cost element schedule (None if no schedule exists)
@@ -99,10 +88,23 @@ def get_cost_element_evm_metrics(
         cost_registrations: List of cost registrations for this cost element
         control_date: Control date for calculations
         forecast_eac: Forecast EAC value, or None if no forecast exists
+        actual_cost: Pre-aggregated AC (e.g. summed in SQL)
 
     Returns:
         CostElementEVMMetrics with all EVM metrics (PV, EV, AC, BAC, EAC, Forecasted Quality, CPI, SPI, TCPI, CV, SV)
+
+    Raises:
+        ValueError: If both or neither of cost_registrations and actual_cost are given
     """
+    # Calculate AC from cost registrations unless already aggregated
+    if cost_registrations is not None:
+        if actual_cost is not None:
+            raise ValueError("Pass either cost_registrations or actual_cost, not both")
+        actual_cost = sum((cr.amount for cr in cost_registrations), ZERO_2P)
+    elif actual_cost is None:
+        raise ValueError("Either cost_registrations or actual_cost is required")
+    ac = actual_cost
+
     # Calculate PV using existing service
     pv, _ = calculate_cost_element_planned_value(
         cost_element=cost_element,
@@ -117,11 +119,8 @@ def get_cost_element_evm_metrics(
         control_date=control_date,
     )
 
-    # Calculate AC from cost registrations
-    ac = sum((cr.amount for cr in cost_registrations), Decimal("0.00"))
-
     # Get BAC from cost element
-    bac = cost_element.budget_bac or Decimal("0.00")
+    bac = cost_element.budget_bac or ZERO_2P
 
     # Calculate EAC using forecast or BAC fallback
     eac = calculate_cost_element_eac(forecast_eac=forecast_eac, budget_bac=bac)
@@ -131,62 +130,46 @@ def get_cost_element_evm_metrics(
         forecast_eac=forecast_eac, calculated_eac=eac
     )
 
-    # Calculate indices using existing service functions
-    cpi = calculate_cpi(ev, ac)
-    spi = calculate_spi(ev, pv)
-    tcpi = calculate_tcpi(bac, ev, ac)
-
-    # Calculate variances using existing service functions
-    cv = calculate_cost_variance(ev, ac)
-    sv = calculate_schedule_variance(ev, pv)
+    # Calculate indices and variances in one pass
+    indices = calculate_all_indices(pv, ev, ac, bac)
 
-    return CostElementEVMMetrics(
+    return EVMMetrics(
         planned_value=pv,
         earned_value=ev,
         actual_cost=ac,
         budget_bac=bac,
         eac=eac,
         forecasted_quality=forecasted_quality,
-        cpi=cpi,
-        spi=spi,
-        tcpi=tcpi,
-        cost_variance=cv,
-        schedule_variance=sv,
+        cpi=indices.cpi,
+        spi=indices.spi,
+        tcpi=indices.tcpi,
+        cost_variance=indices.cost_variance,
+        schedule_variance=indices.schedule_variance,
     )
 
 
 def aggregate_cost_element_metrics(
     metrics: list[CostElementEVMMetrics],
-) -> WBEEVMMetrics | ProjectEVMMetrics:
+) -> EVMMetrics:
     """Aggregate EVM metrics from multiple cost elements.
 
     Args:
         metrics: List of CostElementEVMMetrics to aggregate
 
     Returns:
-        Aggregated metrics (WBEEVMMetrics or ProjectEVMMetrics) with summed PV, EV, AC, BAC
+        Aggregated metrics (for a WBE or project) with summed PV, EV, AC, BAC
         and calculated indices from aggregated values.
     """
     if not metrics:
-        return WBEEVMMetrics(
-            planned_value=Decimal("0.00"),
-            earned_value=Decimal("0.00"),
-            actual_cost=Decimal("0.00"),
-            budget_bac=Decimal("0.00"),
-            eac=Decimal("0.00"),
-            forecasted_quality=Decimal("0.0000"),
-            cpi=None,
-            spi=None,
-            tcpi=None,
-            cost_variance=Decimal("0.00"),
-            schedule_variance=Decimal("0.00"),
-        )
-
-    # Aggregate PV, EV, AC, BAC
-    total_pv = sum((m.planned_value for m in metrics), Decimal("0.00"))
-    total_ev = sum((m.earned_value for m in metrics), Decimal("0.00"))
-    total_ac = sum((m.actual_cost for m in metrics), Decimal("0.00"))
-    total_bac = sum((m.budget_bac for m in metrics), Decimal("0.00"))
+        return _EMPTY_METRICS
+
+    # Aggregate PV, EV, AC, BAC in a single pass over the metrics
+    total_pv = total_ev = total_ac = total_bac = ZERO_2P
+    for m in metrics:
+        total_pv += m.planned_value
+        total_ev += m.earned_value
+        total_ac += m.actual_cost
+        total_bac += m.budget_bac
 
     # Aggregate EAC
     eac_values = [m.eac for m in metrics]
@@ -195,32 +178,26 @@ def aggregate_cost_element_metrics(
     # Calculate forecasted quality
     # Sum of EACs that come from forecasts (where forecasted_quality = 1.0000)
     forecast_eac_sum = sum(
-        (m.eac for m in metrics if m.forecasted_quality == Decimal("1.0000")),
-        Decimal("0.00"),
+        (m.eac for m in metrics if m.forecasted_quality == ONE_4P),
+        ZERO_2P,
     )
     forecasted_quality = aggregate_forecasted_quality(
         forecast_eac_sum=forecast_eac_sum, total_eac=total_eac
     )
 
-    # Calculate indices from aggregated values
-    cpi = calculate_cpi(total_ev, total_ac)
-    spi = calculate_spi(total_ev, total_pv)
-    tcpi = calculate_tcpi(total_bac, total_ev, total_ac)
-
-    # Calculate variances from aggregated values
-    cv = calculate_cost_variance(total_ev, total_ac)
-    sv = calculate_schedule_variance(total_ev, total_pv)
+    # Calculate indices and variances from aggregated values
+    indices = calculate_all_indices(total_pv, total_ev, total_ac, total_bac)
 
-    return WBEEVMMetrics(
+    return EVMMetrics(
         planned_value=total_pv,
         earned_value=total_ev,
         actual_cost=total_ac,
         budget_bac=total_bac,
         eac=total_eac,
         forecasted_quality=forecasted_quality,
-        cpi=cpi,
-        spi=spi,
-        tcpi=tcpi,
-        cost_variance=cv,
-        schedule_variance=sv,
+        cpi=indices.cpi,
+        spi=indices.spi,
+        tcpi=indices.tcpi,
+        cost_variance=indices.cost_variance,
+        schedule_variance=indices.schedule_variance,
     )
@@ -11,6 +11,7 @@ TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
 ONE = Decimal("1.0")
 ZERO = Decimal("0.0")
+ZERO_2P = Decimal("0.00")
 
 
 class EVMIndicesError(Exception):
@@ -130,24 +131,66 @@ def calculate_tcpi(
         - TCPI = 'overrun' when BAC ≤ AC (overrun case)
         - TCPI = None when BAC = AC = 0 (undefined case)
     """
+    # Common case first: BAC > AC also guarantees a non-zero denominator
+    if bac > ac:
+        tcpi = (bac - ev) / (bac - ac)
+        return _quantize(tcpi, FOUR_PLACES)
+
     if bac == ZERO and ac == ZERO:
         return None
 
-    if bac <= ac:
-        return "overrun"
+    return "overrun"
 
-    numerator = bac - ev
-    denominator = bac - ac
 
-    if denominator == ZERO:
-        # This shouldn't happen if BAC > AC, but handle it gracefully
-        return None
+@dataclass(slots=True, frozen=True)
+class IndicesResult:
+    """Variances and performance indices computed from one set of EVM inputs."""
+
+    cost_variance: Decimal
+    schedule_variance: Decimal
+    cpi: Decimal | None
+    spi: Decimal | None
+    tcpi: Decimal | Literal["overrun"] | None
+
 
-    tcpi = numerator / denominator
-    return _quantize(tcpi, FOUR_PLACES)
+def calculate_all_indices(
+    pv: Decimal, ev: Decimal, ac: Decimal, bac: Decimal
+) -> IndicesResult:
+    """Calculate CV, SV, CPI, SPI, and TCPI in a single call.
+
+    Follows the same business rules as the individual ``calculate_*``
+    functions, but shares the zero checks and differences between them.
+
+    Args:
+        pv: Planned Value
+        ev: Earned Value
+        ac: Actual Cost
+        bac: Budget at Completion
+
+    Returns:
+        IndicesResult with variances quantized to 2 decimal places and
+        indices quantized to 4 decimal places (or None / 'overrun').
+    """
+    ac_is_zero = ac == ZERO
+
+    tcpi: Decimal | Literal["overrun"] | None
+    if bac > ac:
+        tcpi = _quantize((bac - ev) / (bac - ac), FOUR_PLACES)
+    elif ac_is_zero and bac == ZERO:
+        tcpi = None
+    else:
+        tcpi = "overrun"
+
+    return IndicesResult(
+        cost_variance=_quantize(ev - ac, TWO_PLACES),
+        schedule_variance=_quantize(ev - pv, TWO_PLACES),
+        cpi=None if ac_is_zero else _quantize(ev / ac, FOUR_PLACES),
+        spi=None if pv == ZERO else _quantize(ev / pv, FOUR_PLACES),
+        tcpi=tcpi,
+    )
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class AggregateResult:
     """Result of aggregating EVM inputs across multiple cost elements."""
 
@@ -169,10 +212,10 @@ def aggregate_evm_indices(
         AggregateResult with total PV, EV, AC, and BAC.
         All values are quantized to 2 decimal places.
     """
-    total_pv = Decimal("0.00")
-    total_ev = Decimal("0.00")
-    total_ac = Decimal("0.00")
-    total_bac = Decimal("0.00")
+    total_pv = ZERO_2P
+    total_ev = ZERO_2P
+    total_ac = ZERO_2P
+    total_bac = ZERO_2P
 
     for pv, ev, ac, bac in values:
         total_pv += pv
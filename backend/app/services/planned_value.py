@@ -14,6 +14,8 @@ TWO_PLACES = Decimal("0.01")
 FOUR_PLACES = Decimal("0.0001")
 ONE = Decimal("1.0")
 ZERO = Decimal("0.0")
+ZERO_2P = Decimal("0.00")
+ZERO_4P = Decimal("0.0000")
 
 
 class PlannedValueError(Exception):
@@ -32,6 +34,14 @@ def _normal_cdf(x: float, mean: float, std_dev: float) -> float:
     return 0.5 * (1 + erf((x - mean) / (std_dev * sqrt(2))))
 
 
+# Gaussian progression curve parameters; the CDF at the end of the schedule
+# normalizes the curve to reach 100% and only depends on these constants
+_GAUSSIAN_MEAN = 0.5
+_GAUSSIAN_STD_DEV = 0.25
+_GAUSSIAN_SCALE = _GAUSSIAN_STD_DEV * sqrt(2)
+_GAUSSIAN_MAX_CDF = _normal_cdf(1.0, _GAUSSIAN_MEAN, _GAUSSIAN_STD_DEV)
+
+
 def calculate_planned_percent_complete(
     start_date: date,
     end_date: date,
@@ -53,11 +63,8 @@ def calculate_planned_percent_complete(
     elif progression == "logarithmic":
         percent = normalized**2
     elif progression == "gaussian":
-        mean = 0.5
-        std_dev = 0.25
-        cumulative = _normal_cdf(normalized, mean, std_dev)
-        max_cdf = _normal_cdf(1.0, mean, std_dev)
-        percent = cumulative / max_cdf if max_cdf else 1.0
+        cumulative = 0.5 * (1 + erf((normalized - _GAUSSIAN_MEAN) / _GAUSSIAN_SCALE))
+        percent = cumulative / _GAUSSIAN_MAX_CDF
     else:
         percent = normalized
 
@@ -90,23 +97,19 @@ def calculate_cost_element_planned_value(
     control_date: date,
 ) -> tuple[Decimal, Decimal]:
     """Calculate planned value and percent for a cost element."""
-    budget_bac = cost_element.budget_bac or Decimal("0.00")
+    budget_bac = cost_element.budget_bac or ZERO_2P
     if schedule is None:
-        return Decimal("0.00"), Decimal("0.0000")
+        return ZERO_2P, ZERO_4P
 
-    planned_value = calculate_planned_value(
-        budget_bac=budget_bac,
-        start_date=schedule.start_date,
-        end_date=schedule.end_date,
-        control_date=control_date,
-        progression_type=schedule.progression_type,
-    )
+    # Compute the percent once and derive PV from it, as calculate_planned_value
+    # would, instead of evaluating the progression curve twice
     percent = calculate_planned_percent_complete(
         start_date=schedule.start_date,
         end_date=schedule.end_date,
         control_date=control_date,
         progression_type=schedule.progression_type,
     )
+    planned_value = _quantize(budget_bac * percent, TWO_PLACES)
     return planned_value, percent
 
 
@@ -121,18 +124,18 @@ def aggregate_planned_value(
     values: Iterable[tuple[Decimal, Decimal]],
 ) -> AggregateResult:
     """Aggregate planned values over multiple cost elements."""
-    total_bac = Decimal("0.00")
-    total_planned_value = Decimal("0.00")
+    total_bac = ZERO_2P
+    total_planned_value = ZERO_2P
 
     for planned_value, budget_bac in values:
         total_planned_value += planned_value
         total_bac += budget_bac
 
-    if total_bac == Decimal("0.00"):
+    if total_bac == ZERO_2P:
         return AggregateResult(
             planned_value=_quantize(total_planned_value, TWO_PLACES),
-            percent_complete=Decimal("0.0000"),
-            budget_bac=Decimal("0.00"),
+            percent_complete=ZERO_4P,
+            budget_bac=ZERO_2P,
         )
 
     percent_complete = total_planned_value / total_bac
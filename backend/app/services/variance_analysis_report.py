@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import uuid
-from datetime import date, timedelta
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
+from operator import attrgetter, itemgetter
+from threading import Lock
+from time import monotonic
+from typing import TypeVar
 
+from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
+from app.api.routes.cost_registrations import _get_actual_cost_map
+from app.api.routes.earned_value import _get_entry_map
+from app.api.routes.planned_value import _get_schedule_map
 from app.models import (
     WBE,
     CostElement,
     CostElementSchedule,
-    CostElementType,
     CostRegistration,
     EarnedValueEntry,
     Project,
@@ -25,22 +35,52 @@ from app.models.variance_analysis_report import (
     VarianceTrendPointPublic,
     VarianceTrendPublic,
 )
+from app.services.earned_value import calculate_cost_element_earned_value
 from app.services.evm_aggregation import get_cost_element_evm_metrics
+from app.services.evm_indices import (
+    calculate_cost_variance,
+    calculate_cpi,
+    calculate_schedule_variance,
+    calculate_spi,
+    calculate_tcpi,
+)
+from app.services.planned_value import calculate_cost_element_planned_value
 from app.services.time_machine import (
     TimeMachineEventType,
     apply_time_machine_filters,
     end_of_day,
 )
 
+# Active thresholds only change through the admin routes, which clear this
+# cache after every write; the TTL bounds staleness across worker processes.
+_THRESHOLD_CACHE_TTL_SECONDS = 30.0
+_threshold_cache: tuple[float, dict[str, Decimal]] | None = None
+_threshold_cache_lock = Lock()
+
+
+def clear_variance_threshold_cache() -> None:
+    """Drop the memoized active thresholds (call after threshold writes)."""
+    global _threshold_cache
+    with _threshold_cache_lock:
+        _threshold_cache = None
+
 
 def get_active_variance_thresholds(session: Session) -> dict[str, Decimal]:
     """Get active variance threshold configurations from database.
 
+    Results are memoized for ``_THRESHOLD_CACHE_TTL_SECONDS``.
+
     Returns:
         Dictionary mapping threshold_type to threshold_percentage.
         Keys: 'critical_cv', 'warning_cv', 'critical_sv', 'warning_sv'
         Returns None for missing threshold types.
     """
+    global _threshold_cache
+    now = monotonic()
+    with _threshold_cache_lock:
+        if _threshold_cache is not None and _threshold_cache[0] > now:
+            return dict(_threshold_cache[1])
+
     statement = select(VarianceThresholdConfig).where(
         VarianceThresholdConfig.is_active == True  # noqa: E712
     )
@@ -51,7 +91,57 @@ def get_active_variance_thresholds(session: Session) -> dict[str, Decimal]:
     for config in configs:
         thresholds[config.threshold_type.value] = config.threshold_percentage
 
-    return thresholds
+    with _threshold_cache_lock:
+        _threshold_cache = (now + _THRESHOLD_CACHE_TTL_SECONDS, thresholds)
+
+    return dict(thresholds)
+
+
+# Severity names indexed by severity code; higher codes are more severe
+_SEVERITY_NAMES: tuple[str | None, ...] = (None, "normal", "warning", "critical")
+
+# (critical_cv, warning_cv, critical_sv, warning_sv) threshold percentages
+_SeverityLimits = tuple[Decimal | None, Decimal | None, Decimal | None, Decimal | None]
+
+
+def _get_severity_limits(thresholds: dict[str, Decimal]) -> _SeverityLimits:
+    """Extract the CV/SV threshold percentages once for repeated severity checks."""
+    return (
+        thresholds.get("critical_cv"),
+        thresholds.get("warning_cv"),
+        thresholds.get("critical_sv"),
+        thresholds.get("warning_sv"),
+    )
+
+
+def _severity_code(
+    percentage: Decimal | None, critical: Decimal | None, warning: Decimal | None
+) -> int:
+    """Severity code of a single variance percentage (0 when undefined)."""
+    if percentage is None:
+        return 0
+    if critical is None or warning is None:
+        # Missing thresholds, default to 'normal'
+        return 1
+    return 3 if percentage < critical else 2 if percentage < warning else 1
+
+
+def _variance_severity(
+    cv_percentage: Decimal | None,
+    sv_percentage: Decimal | None,
+    limits: _SeverityLimits,
+) -> str | None:
+    """``calculate_variance_severity`` with pre-extracted threshold limits."""
+    if cv_percentage is None and sv_percentage is None:
+        # Zero BAC leaves both percentages undefined
+        return None
+    critical_cv, warning_cv, critical_sv, warning_sv = limits
+    return _SEVERITY_NAMES[
+        max(
+            _severity_code(cv_percentage, critical_cv, warning_cv),
+            _severity_code(sv_percentage, critical_sv, warning_sv),
+        )
+    ]
 
 
 def calculate_variance_severity(
@@ -70,70 +160,192 @@ def calculate_variance_severity(
         'critical', 'warning', 'normal', or None if both percentages are undefined.
         Overall severity is the maximum severity of CV and SV.
     """
+    return _variance_severity(
+        cv_percentage, sv_percentage, _get_severity_limits(thresholds)
+    )
 
-    # Helper function to determine severity for a single variance
-    def _get_severity(
-        percentage: Decimal | None, critical_key: str, warning_key: str
-    ) -> str | None:
-        if percentage is None:
-            return None
 
-        critical_threshold = thresholds.get(critical_key)
-        warning_threshold = thresholds.get(warning_key)
+def _utc_date(value: datetime) -> date:
+    """Return the UTC calendar date of a timestamp (naive values are UTC)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
 
-        if critical_threshold is None or warning_threshold is None:
-            # Missing thresholds, default to 'normal'
-            return "normal"
 
-        if percentage < critical_threshold:
-            return "critical"
-        elif percentage < warning_threshold:
-            return "warning"
-        else:
-            return "normal"
+def _visible_from(*dates: date, created_at: datetime) -> date:
+    """Return the first control date at which a time-machine event is visible.
 
-    # Calculate severity for CV and SV
-    cv_severity = _get_severity(cv_percentage, "critical_cv", "warning_cv")
-    sv_severity = _get_severity(sv_percentage, "critical_sv", "warning_sv")
+    Mirrors the time-machine filters: an event is visible once every one of its
+    business dates is on or before the control date and it was created by the
+    end of that day, so visibility only ever switches on as the date advances.
+    """
+    return max(*dates, _utc_date(created_at))
 
-    # Overall severity is the maximum severity
-    if cv_severity is None and sv_severity is None:
-        return None
 
-    # Severity order: critical > warning > normal
-    severity_order = {"critical": 3, "warning": 2, "normal": 1}
+_T = TypeVar("_T")
 
-    severities = [s for s in [cv_severity, sv_severity] if s is not None]
-    if not severities:
-        return None
 
-    # Return the highest severity
-    return max(severities, key=lambda s: severity_order[s])
+def _first_visible(
+    candidates: Sequence[tuple[date, _T]], control_date: date
+) -> _T | None:
+    """Return the first candidate (in priority order) visible at control_date."""
+    for visible_from, candidate in candidates:
+        if visible_from <= control_date:
+            return candidate
+    return None
 
 
-def _get_schedule_map(
-    session: Session, cost_element_ids: list[uuid.UUID], control_date: date
-) -> dict[uuid.UUID, CostElementSchedule | None]:
-    """Get schedule map for cost elements (reused from evm_aggregation)."""
-    from app.api.routes.evm_aggregation import _get_schedule_map as get_schedule_map
+@dataclass(slots=True)
+class _TrendHistory:
+    """Time-machine events of cost elements, keyed by cost_element_id.
+
+    Schedules and entries are in selection priority order; registrations are
+    (visible_from, amount) pairs sorted by visible_from.
+    """
 
-    return get_schedule_map(session, cost_element_ids, control_date)
+    schedules: dict[uuid.UUID, list[tuple[date, CostElementSchedule]]]
+    entries: dict[uuid.UUID, list[tuple[date, EarnedValueEntry]]]
+    registrations: dict[uuid.UUID, list[tuple[date, Decimal]]]
 
 
-def _get_entry_map(
+def _get_trend_cost_elements(
+    session: Session,
+    project_id: uuid.UUID,
+    control_date: date,
+    cost_element_id: uuid.UUID | None,
+    wbe_id: uuid.UUID | None,
+) -> list[CostElement]:
+    """Get the cost elements a variance trend covers up to control_date."""
+    if cost_element_id is not None:
+        cost_element = session.get(CostElement, cost_element_id)
+        return [cost_element] if cost_element else []
+
+    if wbe_id is not None:
+        wbe = session.get(WBE, wbe_id)
+        if not wbe or wbe.project_id != project_id:
+            return []
+        return list(
+            session.exec(select(CostElement).where(CostElement.wbe_id == wbe_id)).all()
+        )
+
+    cutoff = end_of_day(control_date)
+    return list(
+        session.exec(
+            select(CostElement)
+            .join(WBE)
+            .where(
+                WBE.project_id == project_id,
+                CostElement.created_at <= cutoff,
+            )
+        ).all()
+    )
+
+
+# Rows fetched per round-trip when streaming cost registrations
+_REGISTRATION_BATCH_SIZE = 5000
+
+
+def _get_trend_history(
     session: Session, cost_element_ids: list[uuid.UUID], control_date: date
-) -> dict[uuid.UUID, EarnedValueEntry | None]:
-    """Get earned value entry map for cost elements (reused from evm_aggregation)."""
-    from app.api.routes.evm_aggregation import _get_entry_map as get_entry_map
+) -> _TrendHistory:
+    """Load cost element events visible at control_date, one query per type."""
+    history = _TrendHistory(
+        schedules=defaultdict(list),
+        entries=defaultdict(list),
+        registrations=defaultdict(list),
+    )
+    if not cost_element_ids:
+        return history
+
+    # Same selection and priority as the planned value schedule lookup
+    schedules = session.exec(  # type: ignore[call-overload]
+        apply_time_machine_filters(
+            select(CostElementSchedule)
+            .where(CostElementSchedule.cost_element_id.in_(cost_element_ids))  # type: ignore[attr-defined]
+            .where(CostElementSchedule.baseline_id.is_(None)),  # type: ignore[union-attr]
+            TimeMachineEventType.SCHEDULE,
+            control_date,
+        ).order_by(
+            CostElementSchedule.cost_element_id,  # type: ignore[arg-type]
+            CostElementSchedule.registration_date.desc(),  # type: ignore[attr-defined]
+            CostElementSchedule.created_at.desc(),  # type: ignore[attr-defined]
+        )
+    ).all()
+    for schedule in schedules:
+        history.schedules[schedule.cost_element_id].append(
+            (
+                _visible_from(
+                    schedule.registration_date, created_at=schedule.created_at
+                ),
+                schedule,
+            )
+        )
 
-    return get_entry_map(session, cost_element_ids, control_date)
+    # Same selection and priority as the earned value entry lookup
+    entries = session.exec(  # type: ignore[call-overload]
+        apply_time_machine_filters(
+            select(EarnedValueEntry).where(
+                EarnedValueEntry.cost_element_id.in_(cost_element_ids)  # type: ignore[attr-defined]
+            ),
+            TimeMachineEventType.EARNED_VALUE,
+            control_date,
+        ).order_by(
+            EarnedValueEntry.cost_element_id,  # type: ignore[arg-type]
+            EarnedValueEntry.completion_date.desc(),  # type: ignore[attr-defined]
+            EarnedValueEntry.created_at.desc(),  # type: ignore[attr-defined]
+        )
+    ).all()
+    for entry in entries:
+        history.entries[entry.cost_element_id].append(
+            (
+                _visible_from(
+                    entry.completion_date,
+                    entry.registration_date,
+                    created_at=entry.created_at,
+                ),
+                entry,
+            )
+        )
+
+    # Only the columns the running actual cost needs, not full ORM rows,
+    # streamed in batches so the raw result set is never held in full
+    registrations = session.execute(
+        apply_time_machine_filters(
+            select(  # type: ignore[call-overload]
+                CostRegistration.cost_element_id,
+                CostRegistration.registration_date,
+                CostRegistration.created_at,
+                CostRegistration.amount,
+            ).where(
+                CostRegistration.cost_element_id.in_(cost_element_ids)  # type: ignore[attr-defined]
+            ),
+            TimeMachineEventType.COST_REGISTRATION,
+            control_date,
+        ).execution_options(yield_per=_REGISTRATION_BATCH_SIZE)
+    )
+    for registration in registrations:
+        history.registrations[registration.cost_element_id].append(
+            (
+                _visible_from(
+                    registration.registration_date, created_at=registration.created_at
+                ),
+                registration.amount,
+            )
+        )
+    for registration_list in history.registrations.values():
+        registration_list.sort(key=itemgetter(0))
+
+    return history
+
+
+_HUNDRED = Decimal("100")
 
 
 def _calculate_variance_percentage(variance: Decimal, bac: Decimal) -> Decimal | None:
     """Calculate variance percentage (variance / BAC * 100). Returns None if BAC = 0."""
     if bac == 0:
         return None
-    return (variance / bac) * Decimal("100")
+    return (variance / bac) * _HUNDRED
 
 
 def get_variance_analysis_report(
@@ -163,26 +375,21 @@ def get_variance_analysis_report(
     # Get active variance thresholds
     thresholds = get_active_variance_thresholds(session)
 
-    # Get all WBEs for project (respecting control date)
+    # Get all cost elements for project together with their WBE and type
+    # (respecting control date)
     cutoff = end_of_day(control_date)
-    wbes = session.exec(
-        select(WBE).where(
-            WBE.project_id == project_id,
-            WBE.created_at <= cutoff,
-        )
-    ).all()
-
-    # Get all cost elements for project (respecting control date)
-    cost_elements = session.exec(
-        select(CostElement)
-        .join(WBE)
+    cost_element_rows = session.exec(
+        select(CostElement, WBE)
+        .join(WBE, CostElement.wbe_id == WBE.wbe_id)  # type: ignore[arg-type]
+        .options(selectinload(CostElement.cost_element_type))  # type: ignore[arg-type]
         .where(
             WBE.project_id == project_id,
+            WBE.created_at <= cutoff,
             CostElement.created_at <= cutoff,
         )
     ).all()
 
-    if not cost_elements:
+    if not cost_element_rows:
         # Return empty report with zero summary
         summary = EVMIndicesProjectPublic(
             level="project",
@@ -208,11 +415,8 @@ def get_variance_analysis_report(
             config_used={k: str(v) for k, v in thresholds.items()},
         )
 
-    # Create WBE lookup map
-    wbe_map = {wbe.wbe_id: wbe for wbe in wbes}
-
     # Get cost element IDs
-    cost_element_ids = [ce.cost_element_id for ce in cost_elements]
+    cost_element_ids = [ce.cost_element_id for ce, _wbe in cost_element_rows]
 
     # Get schedules
     schedule_map = _get_schedule_map(session, cost_element_ids, control_date)
@@ -220,38 +424,11 @@ def get_variance_analysis_report(
     # Get earned value entries
     entry_map = _get_entry_map(session, cost_element_ids, control_date)
 
-    # Get cost registrations
-    statement = select(CostRegistration).where(
-        CostRegistration.cost_element_id.in_(cost_element_ids),
-    )
-    statement = apply_time_machine_filters(
-        statement, TimeMachineEventType.COST_REGISTRATION, control_date
-    )
-    all_cost_registrations = session.exec(statement).all()
-
-    # Group cost registrations by cost element
-    cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-    for cr in all_cost_registrations:
-        if cr.cost_element_id not in cost_registrations_by_ce:
-            cost_registrations_by_ce[cr.cost_element_id] = []
-        cost_registrations_by_ce[cr.cost_element_id].append(cr)
-
-    # Get cost element types for metadata
-    cost_element_type_ids = {
-        ce.cost_element_type_id
-        for ce in cost_elements
-        if ce.cost_element_type_id is not None
-    }
-    cost_element_types = {}
-    if cost_element_type_ids:
-        cet_list = session.exec(
-            select(CostElementType).where(
-                CostElementType.cost_element_type_id.in_(cost_element_type_ids)
-            )
-        ).all()
-        cost_element_types = {cet.cost_element_type_id: cet for cet in cet_list}
+    # Sum cost registrations per cost element in the database
+    actual_cost_map = _get_actual_cost_map(session, cost_element_ids, control_date)
 
     # Calculate metrics for each cost element and build rows
+    severity_limits = _get_severity_limits(thresholds)
     rows = []
     total_pv = Decimal("0.00")
     total_ev = Decimal("0.00")
@@ -259,22 +436,32 @@ def get_variance_analysis_report(
     total_bac = Decimal("0.00")
     total_problem_areas = 0
 
-    for cost_element in cost_elements:
-        wbe = wbe_map.get(cost_element.wbe_id)
-        if not wbe:
-            continue  # Skip if WBE not found (shouldn't happen)
-
+    for cost_element, wbe in cost_element_rows:
         # Get EVM metrics
         metrics = get_cost_element_evm_metrics(
             cost_element=cost_element,
             schedule=schedule_map.get(cost_element.cost_element_id),
             entry=entry_map.get(cost_element.cost_element_id),
-            cost_registrations=cost_registrations_by_ce.get(
-                cost_element.cost_element_id, []
-            ),
             control_date=control_date,
+            actual_cost=actual_cost_map[cost_element.cost_element_id],
         )
 
+        # Accumulate totals for summary
+        total_pv += metrics.planned_value
+        total_ev += metrics.earned_value
+        total_ac += metrics.actual_cost
+        total_bac += metrics.budget_bac
+
+        # Check if has issues
+        has_cost_variance_issue = metrics.cost_variance < 0
+        has_schedule_variance_issue = metrics.schedule_variance < 0
+
+        # Count problem areas, and only build rows for them if requested
+        if has_cost_variance_issue or has_schedule_variance_issue:
+            total_problem_areas += 1
+        elif show_only_problems:
+            continue
+
         # Calculate variance percentages
         cv_percentage = _calculate_variance_percentage(
             metrics.cost_variance, metrics.budget_bac
@@ -284,29 +471,16 @@ def get_variance_analysis_report(
         )
 
         # Calculate variance severity
-        variance_severity = calculate_variance_severity(
-            cv_percentage=cv_percentage,
-            sv_percentage=sv_percentage,
-            thresholds=thresholds,
+        variance_severity = _variance_severity(
+            cv_percentage, sv_percentage, severity_limits
         )
 
-        # Check if has issues
-        has_cost_variance_issue = metrics.cost_variance < 0
-        has_schedule_variance_issue = metrics.schedule_variance < 0
-
-        # Count problem areas
-        if has_cost_variance_issue or has_schedule_variance_issue:
-            total_problem_areas += 1
-
         # Get cost element type name
-        cost_element_type_name = None
-        if cost_element.cost_element_type_id:
-            cet = cost_element_types.get(cost_element.cost_element_type_id)
-            if cet:
-                cost_element_type_name = cet.type_name
-
-        # Create row
-        row = VarianceAnalysisReportRowPublic(
+        cet = cost_element.cost_element_type
+        cost_element_type_name = cet.type_name if cet else None
+
+        # Create row; values are computed here, so validation is skipped
+        row = VarianceAnalysisReportRowPublic.model_construct(
             cost_element_id=cost_element.cost_element_id,
             wbe_id=wbe.wbe_id,
             wbe_name=wbe.machine_type,
@@ -332,35 +506,13 @@ def get_variance_analysis_report(
         )
         rows.append(row)
 
-        # Accumulate totals for summary
-        total_pv += metrics.planned_value
-        total_ev += metrics.earned_value
-        total_ac += metrics.actual_cost
-        total_bac += metrics.budget_bac
-
-    # Filter to problem areas if requested
-    if show_only_problems:
-        rows = [
-            row
-            for row in rows
-            if row.has_cost_variance_issue or row.has_schedule_variance_issue
-        ]
-
     # Sort rows by variance (most negative first)
     if sort_by == "cv":
-        rows.sort(key=lambda r: r.cost_variance)
+        rows.sort(key=attrgetter("cost_variance"))
     elif sort_by == "sv":
-        rows.sort(key=lambda r: r.schedule_variance)
+        rows.sort(key=attrgetter("schedule_variance"))
 
     # Calculate project summary indices
-    from app.services.evm_indices import (
-        calculate_cost_variance,
-        calculate_cpi,
-        calculate_schedule_variance,
-        calculate_spi,
-        calculate_tcpi,
-    )
-
     summary_cpi = calculate_cpi(total_ev, total_ac)
     summary_spi = calculate_spi(total_ev, total_pv)
     summary_tcpi = calculate_tcpi(total_bac, total_ev, total_ac)
@@ -393,27 +545,24 @@ def get_variance_analysis_report(
     )
 
 
-def _generate_monthly_dates(start_date: date, end_date: date) -> list[date]:
-    """Generate list of first-of-month dates from start_date to end_date (monthly granularity)."""
-    dates = []
-    current_date = start_date.replace(day=1)  # First day of start month
+def _generate_monthly_periods(
+    start_date: date, end_date: date
+) -> list[tuple[date, date]]:
+    """Generate (first-of-month, month control date) pairs from start_date to end_date.
 
-    while current_date <= end_date:
-        dates.append(current_date)
-        # Move to first day of next month
-        if current_date.month == 12:
-            current_date = current_date.replace(
-                year=current_date.year + 1, month=1, day=1
-            )
-        else:
-            current_date = current_date.replace(month=current_date.month + 1, day=1)
+    The month control date is the last day of the month, capped at end_date.
+    """
+    periods = []
+    month_start = start_date.replace(day=1)  # First day of start month
 
-    # Ensure end_date month is included if not already
-    end_month_start = end_date.replace(day=1)
-    if dates and dates[-1] < end_month_start:
-        dates.append(end_month_start)
+    while month_start <= end_date:
+        # Day 32 after the 1st always falls in the next month
+        next_month_start = (month_start + timedelta(days=32)).replace(day=1)
+        month_end = next_month_start - timedelta(days=1)
+        periods.append((month_start, min(month_end, end_date)))
+        month_start = next_month_start
 
-    return dates
+    return periods
 
 
 def get_variance_trend(
@@ -444,10 +593,10 @@ def get_variance_trend(
     if cost_element_id is not None and wbe_id is not None:
         raise ValueError("Cannot provide both cost_element_id and wbe_id")
 
-    # Generate monthly dates from project start_date to control_date
-    monthly_dates = _generate_monthly_dates(project.start_date, control_date)
+    # Generate monthly periods from project start_date to control_date
+    monthly_periods = _generate_monthly_periods(project.start_date, control_date)
 
-    if not monthly_dates:
+    if not monthly_periods:
         # No months to analyze
         return VarianceTrendPublic(
             project_id=project.project_id,
@@ -457,167 +606,82 @@ def get_variance_trend(
             trend_points=[],
         )
 
-    trend_points = []
+    # Load the cost elements in scope and their history up to the final
+    # control date once; earlier months are answered from it in Python
+    cost_elements = _get_trend_cost_elements(
+        session, project_id, control_date, cost_element_id, wbe_id
+    )
+    cost_element_ids = [ce.cost_element_id for ce in cost_elements]
+    history = _get_trend_history(session, cost_element_ids, control_date)
 
-    # For each month, calculate CV and SV as of that month's end
-    for month_start in monthly_dates:
-        # Calculate month end date (last day of the month)
-        if month_start.month == 12:
-            month_end = month_start.replace(
-                year=month_start.year + 1, month=1, day=1
-            ) - timedelta(days=1)
-        else:
-            month_end = month_start.replace(
-                month=month_start.month + 1, day=1
-            ) - timedelta(days=1)
-
-        # Use month_end as control date, but don't exceed current control_date
-        month_control_date = min(month_end, control_date)
-
-        # Calculate EVM metrics as of this month's end
-        if cost_element_id is not None:
-            # Cost element level: calculate for single cost element
-            cost_element = session.get(CostElement, cost_element_id)
-            if not cost_element:
-                continue
-
-            # Get EVM metrics for this cost element
-            schedule_map = _get_schedule_map(
-                session, [cost_element_id], month_control_date
-            )
-            entry_map = _get_entry_map(session, [cost_element_id], month_control_date)
+    # Running actual cost per cost element; months are walked in order, so each
+    # registration is added exactly once
+    actual_costs = dict.fromkeys(cost_element_ids, Decimal("0.00"))
+    next_registration = dict.fromkeys(cost_element_ids, 0)
 
-            statement = select(CostRegistration).where(
-                CostRegistration.cost_element_id == cost_element_id,
-            )
-            statement = apply_time_machine_filters(
-                statement, TimeMachineEventType.COST_REGISTRATION, month_control_date
-            )
-            cost_registrations = session.exec(statement).all()
+    trend_points = []
 
-            metrics = get_cost_element_evm_metrics(
+    # For each month, calculate CV and SV as of that month's end (but not
+    # beyond the current control_date)
+    for month_start, month_control_date in monthly_periods:
+        # Project level only counts cost elements created by the month's end
+        if cost_element_id is None and wbe_id is None:
+            month_cost_elements = [
+                ce
+                for ce in cost_elements
+                if _utc_date(ce.created_at) <= month_control_date
+            ]
+        else:
+            month_cost_elements = cost_elements
+
+        if not month_cost_elements:
+            continue
+
+        # Calculate CV, SV and BAC as of this month's end; the trend only
+        # needs these, so the remaining EVM metrics are not computed
+        total_cv = Decimal("0.00")
+        total_sv = Decimal("0.00")
+        total_bac = Decimal("0.00")
+        for cost_element in month_cost_elements:
+            ce_id = cost_element.cost_element_id
+
+            registrations = history.registrations.get(ce_id, ())
+            index = next_registration[ce_id]
+            while (
+                index < len(registrations)
+                and registrations[index][0] <= month_control_date
+            ):
+                actual_costs[ce_id] += registrations[index][1]
+                index += 1
+            next_registration[ce_id] = index
+
+            pv, _ = calculate_cost_element_planned_value(
                 cost_element=cost_element,
-                schedule=schedule_map.get(cost_element_id),
-                entry=entry_map.get(cost_element_id),
-                cost_registrations=list(cost_registrations),
+                schedule=_first_visible(
+                    history.schedules.get(ce_id, ()), month_control_date
+                ),
                 control_date=month_control_date,
             )
-
-            total_cv = metrics.cost_variance
-            total_sv = metrics.schedule_variance
-            total_bac = metrics.budget_bac
-
-        elif wbe_id is not None:
-            # WBE level: aggregate all cost elements in WBE
-            wbe = session.get(WBE, wbe_id)
-            if not wbe or wbe.project_id != project_id:
-                continue
-
-            cost_elements_in_wbe = session.exec(
-                select(CostElement).where(CostElement.wbe_id == wbe_id)
-            ).all()
-
-            if not cost_elements_in_wbe:
-                continue
-
-            cost_element_ids = [ce.cost_element_id for ce in cost_elements_in_wbe]
-            schedule_map = _get_schedule_map(
-                session, cost_element_ids, month_control_date
-            )
-            entry_map = _get_entry_map(session, cost_element_ids, month_control_date)
-
-            statement = select(CostRegistration).where(
-                CostRegistration.cost_element_id.in_(cost_element_ids),
-            )
-            statement = apply_time_machine_filters(
-                statement, TimeMachineEventType.COST_REGISTRATION, month_control_date
-            )
-            all_cost_registrations = session.exec(statement).all()
-
-            cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-            for cr in all_cost_registrations:
-                if cr.cost_element_id not in cost_registrations_by_ce:
-                    cost_registrations_by_ce[cr.cost_element_id] = []
-                cost_registrations_by_ce[cr.cost_element_id].append(cr)
-
-            total_cv = Decimal("0.00")
-            total_sv = Decimal("0.00")
-            total_bac = Decimal("0.00")
-
-            for cost_element in cost_elements_in_wbe:
-                metrics = get_cost_element_evm_metrics(
-                    cost_element=cost_element,
-                    schedule=schedule_map.get(cost_element.cost_element_id),
-                    entry=entry_map.get(cost_element.cost_element_id),
-                    cost_registrations=cost_registrations_by_ce.get(
-                        cost_element.cost_element_id, []
-                    ),
-                    control_date=month_control_date,
-                )
-
-                total_cv += metrics.cost_variance
-                total_sv += metrics.schedule_variance
-                total_bac += metrics.budget_bac
-        else:
-            # Project level: aggregate all cost elements in project
-            cutoff = end_of_day(month_control_date)
-            cost_elements = session.exec(
-                select(CostElement)
-                .join(WBE)
-                .where(
-                    WBE.project_id == project_id,
-                    CostElement.created_at <= cutoff,
-                )
-            ).all()
-
-            if not cost_elements:
-                continue
-
-            cost_element_ids = [ce.cost_element_id for ce in cost_elements]
-            schedule_map = _get_schedule_map(
-                session, cost_element_ids, month_control_date
+            ev, _ = calculate_cost_element_earned_value(
+                cost_element=cost_element,
+                entry=_first_visible(
+                    history.entries.get(ce_id, ()), month_control_date
+                ),
+                control_date=month_control_date,
             )
-            entry_map = _get_entry_map(session, cost_element_ids, month_control_date)
 
-            statement = select(CostRegistration).where(
-                CostRegistration.cost_element_id.in_(cost_element_ids),
-            )
-            statement = apply_time_machine_filters(
-                statement, TimeMachineEventType.COST_REGISTRATION, month_control_date
-            )
-            all_cost_registrations = session.exec(statement).all()
-
-            cost_registrations_by_ce: dict[uuid.UUID, list[CostRegistration]] = {}
-            for cr in all_cost_registrations:
-                if cr.cost_element_id not in cost_registrations_by_ce:
-                    cost_registrations_by_ce[cr.cost_element_id] = []
-                cost_registrations_by_ce[cr.cost_element_id].append(cr)
-
-            total_cv = Decimal("0.00")
-            total_sv = Decimal("0.00")
-            total_bac = Decimal("0.00")
-
-            for cost_element in cost_elements:
-                metrics = get_cost_element_evm_metrics(
-                    cost_element=cost_element,
-                    schedule=schedule_map.get(cost_element.cost_element_id),
-                    entry=entry_map.get(cost_element.cost_element_id),
-                    cost_registrations=cost_registrations_by_ce.get(
-                        cost_element.cost_element_id, []
-                    ),
-                    control_date=month_control_date,
-                )
-
-                total_cv += metrics.cost_variance
-                total_sv += metrics.schedule_variance
-                total_bac += metrics.budget_bac
+            # Aggregate over all cost elements in scope (a single one at cost
+            # element level)
+            total_cv += calculate_cost_variance(ev, actual_costs[ce_id])
+            total_sv += calculate_schedule_variance(ev, pv)
+            total_bac += cost_element.budget_bac or Decimal("0.00")
 
         # Calculate variance percentages
         cv_percentage = _calculate_variance_percentage(total_cv, total_bac)
         sv_percentage = _calculate_variance_percentage(total_sv, total_bac)
 
-        # Create trend point
-        trend_point = VarianceTrendPointPublic(
+        # Create trend point; values are computed here, so validation is skipped
+        trend_point = VarianceTrendPointPublic.model_construct(
             month=month_start,
             cost_variance=total_cv,
             schedule_variance=total_sv,
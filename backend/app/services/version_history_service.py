@@ -6,7 +6,7 @@ from typing import Any
 from sqlmodel import Session, select
 
 from app.models import BranchVersionMixin
-from app.services.version_service import ENTITY_TYPE_MAP
+from app.services.version_service import VersionService
 
 
 def get_version_history(
@@ -16,6 +16,7 @@ def get_version_history(
     branch: str | None = None,
     skip: int = 0,
     limit: int = 100,
+    include_data: bool = False,
 ) -> list[dict[str, Any]]:
     """Get version history for an entity.
 
@@ -26,14 +27,12 @@ def get_version_history(
         branch: Branch name (only for branch-enabled entities)
         skip: Number of records to skip
         limit: Maximum number of records to return
+        include_data: Also include the full serialized entity under ``data``
 
     Returns:
         List of version records with metadata
     """
-    if entity_type not in ENTITY_TYPE_MAP:
-        raise ValueError(f"Unknown entity type: {entity_type}")
-
-    model_class = ENTITY_TYPE_MAP[entity_type]
+    model_class = VersionService.get_model_class(entity_type)
     is_branch_enabled = issubclass(model_class, BranchVersionMixin)
 
     # Build query
@@ -57,20 +56,18 @@ def get_version_history(
 
     versions = session.exec(statement).all()
 
-    # Convert to dict with metadata
+    # Convert to dict with metadata; the full entity is only serialized on request
     result = []
     for version in versions:
-        version_dict = version.model_dump()
-        # Include key metadata fields
-        result.append(
-            {
-                "version": version_dict.get("version"),
-                "status": version_dict.get("status"),
-                "branch": version_dict.get("branch") if is_branch_enabled else None,
-                "created_at": version_dict.get("created_at"),
-                "updated_at": version_dict.get("updated_at"),
-                "data": version_dict,  # Full entity data
-            }
-        )
+        record: dict[str, Any] = {
+            "version": version.version,
+            "status": version.status,
+            "branch": version.branch if is_branch_enabled else None,
+            "created_at": getattr(version, "created_at", None),
+            "updated_at": getattr(version, "updated_at", None),
+        }
+        if include_data:
+            record["data"] = version.model_dump()  # Full entity data
+        result.append(record)
 
     return result
@@ -5,7 +5,10 @@ with versioning support (VersionStatusMixin and BranchVersionMixin).
 """
 
 import uuid
+from collections.abc import Iterable
+from typing import Any
 
+from sqlalchemy import bindparam, insert
 from sqlmodel import Session, func, select
 
 from app.models import (
@@ -14,6 +17,7 @@ from app.models import (
     AuditLog,
     BaselineCostElement,
     BaselineLog,
+    BranchVersionMixin,
     BudgetAllocation,
     ChangeOrder,
     CostElement,
@@ -31,42 +35,102 @@ from app.models import (
     VarianceThresholdConfig,
 )
 
-# Map entity type names to model classes
+# Map canonical entity type names (lowercase, without underscores) to model
+# classes; see ``_canonical_entity_type``
 ENTITY_TYPE_MAP: dict[str, type] = {
     "wbe": WBE,
     "costelement": CostElement,
     "project": Project,
     "user": User,
     "forecast": Forecast,
-    "app_configuration": AppConfiguration,
-    "variance_threshold_config": VarianceThresholdConfig,
+    "appconfiguration": AppConfiguration,
+    "variancethresholdconfig": VarianceThresholdConfig,
     "projectphase": ProjectPhase,
-    "project_phase": ProjectPhase,
     "qualityevent": QualityEvent,
-    "quality_event": QualityEvent,
     "projectevent": ProjectEvent,
-    "project_event": ProjectEvent,
     "budgetallocation": BudgetAllocation,
-    "budget_allocation": BudgetAllocation,
     "changeorder": ChangeOrder,
-    "change_order": ChangeOrder,
     "earnedvalueentry": EarnedValueEntry,
-    "earned_value_entry": EarnedValueEntry,
     "costregistration": CostRegistration,
-    "cost_registration": CostRegistration,
     "costelementtype": CostElementType,
     "costelementschedule": CostElementSchedule,
-    "cost_element_schedule": CostElementSchedule,
     "department": Department,
     "baselinelog": BaselineLog,
-    "baseline_log": BaselineLog,
     "baselinecostelement": BaselineCostElement,
-    "baseline_cost_element": BaselineCostElement,
     "auditlog": AuditLog,
-    "audit_log": AuditLog,
 }
 
 
+def _canonical_entity_type(entity_type: str) -> str:
+    """Normalize an entity type name ('cost_element_schedule' -> 'costelementschedule')."""
+    return entity_type.lower().replace("_", "")
+
+
+# Column identifying an entity across versions, per model class
+_IDENTIFIER_COLUMNS: dict[type, Any] = {}
+
+
+def _get_identifier_column(model_class: type) -> Any:
+    """Return the (cached) entity_id attribute, or primary key if there is none."""
+    identifier_column = _IDENTIFIER_COLUMNS.get(model_class)
+    if identifier_column is None:
+        identifier_column = getattr(model_class, "entity_id", None)
+        if identifier_column is None:
+            pk_column = next(iter(model_class.__table__.primary_key.columns))  # type: ignore[attr-defined]
+            identifier_column = getattr(model_class, pk_column.name)
+        _IDENTIFIER_COLUMNS[model_class] = identifier_column
+    return identifier_column
+
+
+# Parameterized "max version" query per model class, built once and executed
+# with bound identifier/branch values so it is not rebuilt on every call
+_MAX_VERSION_STATEMENTS: dict[type, Any] = {}
+
+
+def _get_max_version_statement(model_class: type) -> Any:
+    """Return the (cached) max-version query of a model class.
+
+    The query binds ``identifier`` and, for branch-enabled models, ``branch``.
+    """
+    statement = _MAX_VERSION_STATEMENTS.get(model_class)
+    if statement is None:
+        identifier_column = _get_identifier_column(model_class)
+        statement = select(func.max(model_class.version)).where(  # type: ignore[attr-defined]
+            identifier_column == bindparam("identifier")
+        )
+        if issubclass(model_class, BranchVersionMixin):
+            statement = statement.where(model_class.branch == bindparam("branch"))
+        _MAX_VERSION_STATEMENTS[model_class] = statement
+    return statement
+
+
+# Parameterized "current active version" query per model class, cached like
+# the max-version query above
+_CURRENT_VERSION_STATEMENTS: dict[type, Any] = {}
+
+
+def _get_current_version_statement(model_class: type) -> Any:
+    """Return the (cached) current active version query of a model class.
+
+    The query binds ``identifier`` and, for branch-enabled models, ``branch``.
+    """
+    statement = _CURRENT_VERSION_STATEMENTS.get(model_class)
+    if statement is None:
+        identifier_column = _get_identifier_column(model_class)
+        statement = select(model_class.version).where(  # type: ignore[attr-defined]
+            identifier_column == bindparam("identifier")
+        )
+        if issubclass(model_class, BranchVersionMixin):
+            statement = statement.where(model_class.branch == bindparam("branch"))
+        statement = (
+            statement.where(model_class.status == "active")  # type: ignore[attr-defined]
+            .order_by(model_class.version.desc())  # type: ignore[attr-defined]
+            .limit(1)
+        )
+        _CURRENT_VERSION_STATEMENTS[model_class] = statement
+    return statement
+
+
 class VersionService:
     """Service for managing entity versions."""
 
@@ -75,7 +139,7 @@ class VersionService:
         """Get model class for entity type.
 
         Args:
-            entity_type: Entity type name (e.g., 'wbe', 'costelement')
+            entity_type: Entity type name (e.g., 'wbe', 'costelement', 'cost_element_schedule')
 
         Returns:
             Model class
@@ -83,10 +147,10 @@ class VersionService:
         Raises:
             ValueError: If entity_type is not recognized
         """
-        entity_type_lower = entity_type.lower()
-        if entity_type_lower not in ENTITY_TYPE_MAP:
+        model_class = ENTITY_TYPE_MAP.get(_canonical_entity_type(entity_type))
+        if model_class is None:
             raise ValueError(f"Unknown entity type: {entity_type}")
-        return ENTITY_TYPE_MAP[entity_type_lower]
+        return model_class
 
     @staticmethod
     def get_next_version(
@@ -112,8 +176,6 @@ class VersionService:
         Raises:
             ValueError: If entity_type is not recognized or branch is required but not provided
         """
-        import uuid
-
         model_class = VersionService.get_model_class(entity_type)
         entity_id_uuid = (
             uuid.UUID(str(entity_id))
@@ -121,16 +183,7 @@ class VersionService:
             else entity_id
         )
 
-        # Determine identifier column (entity_id if available, else primary key)
-        pk_column = list(model_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-        pk_field_name = pk_column.name
-        pk_field = getattr(model_class, pk_field_name)
-        entity_id_field = getattr(model_class, "entity_id", None)
-        identifier_column = entity_id_field or pk_field
-
         # Check if model is branch-enabled
-        from app.models import BranchVersionMixin
-
         is_branch_enabled = issubclass(model_class, BranchVersionMixin)
 
         if is_branch_enabled and branch is None:
@@ -138,22 +191,144 @@ class VersionService:
                 f"Branch is required for branch-enabled entity type: {entity_type}"
             )
 
-        # Build query to find max version
+        # Find max version with the prebuilt query of the model class
+        params: dict[str, Any] = {"identifier": entity_id_uuid}
         if is_branch_enabled:
-            statement = (
-                select(func.max(model_class.version))  # type: ignore[attr-defined]
-                .where(identifier_column == entity_id_uuid)
-                .where(model_class.branch == branch)  # type: ignore[attr-defined]
+            params["branch"] = branch
+        max_version = session.exec(
+            _get_max_version_statement(model_class), params=params
+        ).one()
+
+        # Return next version (max_version + 1, or 1 if no versions exist)
+        return (max_version or 0) + 1
+
+    @staticmethod
+    def allocate_and_insert(
+        session: Session,
+        model_class: type,
+        values: dict[str, Any],
+        entity_id: str | uuid.UUID,
+        branch: str | None = None,
+    ) -> int:
+        """Insert a new entity version, allocating its version number in SQL.
+
+        Unlike ``get_next_version`` followed by an INSERT, the next version is
+        computed by a ``COALESCE(MAX(version), 0) + 1`` subquery inside a
+        single ``INSERT ... RETURNING version`` statement, saving a round-trip
+        and narrowing the window between reading and writing the version.
+
+        The row is written with SQLAlchemy Core, so no ORM instance is added
+        to the session.
+
+        Args:
+            session: Database session
+            model_class: Versioned model class to insert into
+            values: Field values of the new row (model defaults fill the rest;
+                any ``version`` is ignored)
+            entity_id: Entity ID (UUID)
+            branch: Branch name (required for branch-enabled entities, None for others)
+
+        Returns:
+            Version number assigned to the inserted row
+
+        Raises:
+            ValueError: If branch is required but not provided
+        """
+        entity_id_uuid = (
+            uuid.UUID(str(entity_id))
+            if not isinstance(entity_id, uuid.UUID)
+            else entity_id
+        )
+
+        # Check if model is branch-enabled
+        is_branch_enabled = issubclass(model_class, BranchVersionMixin)
+
+        if is_branch_enabled and branch is None:
+            raise ValueError(
+                f"Branch is required for branch-enabled entity type: {model_class.__name__}"
             )
-        else:
-            statement = select(func.max(model_class.version)).where(  # type: ignore[attr-defined]
-                identifier_column == entity_id_uuid
+
+        identifier_column = _get_identifier_column(model_class)
+        overrides: dict[str, Any] = {identifier_column.key: entity_id_uuid}
+        if is_branch_enabled:
+            overrides["branch"] = branch
+
+        # Instantiate the model so field defaults (primary key, timestamps,
+        # status) are applied, then let the database pick the version
+        row = model_class(**{**values, **overrides}).model_dump()
+        row.pop("version", None)
+
+        next_version = select(
+            func.coalesce(func.max(model_class.version), 0) + 1  # type: ignore[attr-defined]
+        ).where(identifier_column == entity_id_uuid)
+        if is_branch_enabled:
+            next_version = next_version.where(model_class.branch == branch)  # type: ignore[attr-defined]
+
+        table = model_class.__table__  # type: ignore[attr-defined]
+        inserted_version: int = session.execute(
+            insert(table)
+            .values(**row, version=next_version.scalar_subquery())
+            .returning(table.c.version)
+        ).scalar_one()
+        return inserted_version
+
+    @staticmethod
+    def get_next_versions_bulk(
+        session: Session,
+        entity_type: str,
+        entity_ids: Iterable[str | uuid.UUID],
+        branch: str | None = None,
+    ) -> dict[uuid.UUID, int]:
+        """Get the next version number for several entities in one query.
+
+        Bulk counterpart of ``get_next_version``: a single
+        ``SELECT identifier, MAX(version) ... GROUP BY identifier`` replaces
+        one round-trip per entity.
+
+        Args:
+            session: Database session
+            entity_type: Entity type name (e.g., 'wbe', 'costelement', 'project')
+            entity_ids: Entity IDs (UUIDs)
+            branch: Branch name (required for branch-enabled entities, None for others)
+
+        Returns:
+            Dictionary mapping each entity ID to its next version number
+            (1 for entities without any versions)
+
+        Raises:
+            ValueError: If entity_type is not recognized or branch is required but not provided
+        """
+        model_class = VersionService.get_model_class(entity_type)
+        entity_id_uuids = {
+            entity_id if isinstance(entity_id, uuid.UUID) else uuid.UUID(str(entity_id))
+            for entity_id in entity_ids
+        }
+
+        identifier_column = _get_identifier_column(model_class)
+
+        # Check if model is branch-enabled
+        is_branch_enabled = issubclass(model_class, BranchVersionMixin)
+
+        if is_branch_enabled and branch is None:
+            raise ValueError(
+                f"Branch is required for branch-enabled entity type: {entity_type}"
             )
 
-        max_version = session.exec(statement).one()
+        next_versions = dict.fromkeys(entity_id_uuids, 1)
+        if not entity_id_uuids:
+            return next_versions
 
-        # Return next version (max_version + 1, or 1 if no versions exist)
-        return (max_version or 0) + 1
+        statement = (
+            select(identifier_column, func.max(model_class.version))  # type: ignore[attr-defined]
+            .where(identifier_column.in_(entity_id_uuids))
+            .group_by(identifier_column)
+        )
+        if is_branch_enabled:
+            statement = statement.where(model_class.branch == branch)  # type: ignore[attr-defined]
+
+        for identifier, max_version in session.exec(statement).all():
+            next_versions[identifier] = (max_version or 0) + 1
+        return next_versions
 
     @staticmethod
     def get_current_version(
@@ -179,8 +354,6 @@ class VersionService:
         Raises:
             ValueError: If entity_type is not recognized or branch is required but not provided
         """
-        import uuid
-
         model_class = VersionService.get_model_class(entity_type)
         entity_id_uuid = (
             uuid.UUID(str(entity_id))
@@ -188,15 +361,7 @@ class VersionService:
             else entity_id
         )
 
-        pk_column = list(model_class.__table__.primary_key.columns)[0]  # type: ignore[attr-defined]
-        pk_field_name = pk_column.name
-        pk_field = getattr(model_class, pk_field_name)
-        entity_id_field = getattr(model_class, "entity_id", None)
-        identifier_column = entity_id_field or pk_field
-
         # Check if model is branch-enabled
-        from app.models import BranchVersionMixin
-
         is_branch_enabled = issubclass(model_class, BranchVersionMixin)
 
         if is_branch_enabled and branch is None:
@@ -204,24 +369,11 @@ class VersionService:
                 f"Branch is required for branch-enabled entity type: {entity_type}"
             )
 
-        # Build query to find active version
+        # Find active version with the prebuilt query of the model class
+        params: dict[str, Any] = {"identifier": entity_id_uuid}
         if is_branch_enabled:
-            statement = (
-                select(model_class.version)  # type: ignore[attr-defined]
-                .where(identifier_column == entity_id_uuid)
-                .where(model_class.branch == branch)  # type: ignore[attr-defined]
-                .where(model_class.status == "active")  # type: ignore[attr-defined]
-                .order_by(model_class.version.desc())  # type: ignore[attr-defined]
-                .limit(1)
-            )
-        else:
-            statement = (
-                select(model_class.version)  # type: ignore[attr-defined]
-                .where(identifier_column == entity_id_uuid)
-                .where(model_class.status == "active")  # type: ignore[attr-defined]
-                .order_by(model_class.version.desc())  # type: ignore[attr-defined]
-                .limit(1)
-            )
-
-        result = session.exec(statement).first()
-        return result
+            params["branch"] = branch
+        current_version: int | None = session.exec(
+            _get_current_version_statement(model_class), params=params
+        ).first()
+        return current_version
@@ -197,3 +197,31 @@ def test_get_cost_performance_report_empty_project(
     assert content["summary"]["budget_bac"] == "0.00"
     assert content["summary"]["actual_cost"] == "0.00"
     assert content["summary"]["earned_value"] == "0.00"
+
+
+def test_stream_cost_performance_rows(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    """Test that streamed NDJSON rows match the rows of the full report."""
+    import json
+
+    from tests.utils.cost_element import create_random_cost_element
+
+    ce = create_random_cost_element(db)
+    wbe = db.get(WBE, ce.wbe_id)
+    assert wbe is not None
+    set_time_machine_date(client, superuser_token_headers, date.today())
+
+    report_response = client.get(
+        f"{settings.API_V1_STR}/projects/{wbe.project_id}/reports/cost-performance",
+        headers=superuser_token_headers,
+    )
+    response = client.get(
+        f"{settings.API_V1_STR}/projects/{wbe.project_id}/reports/cost-performance/rows",
+        headers=superuser_token_headers,
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows == report_response.json()["rows"]
+    assert rows[0]["cost_element_id"] == str(ce.cost_element_id)
@@ -592,3 +592,31 @@ def test_update_cost_registration_date_before_start(
     content = response.json()
     assert "registration date" in content["detail"].lower()
     assert "before" in content["detail"].lower() or "start" in content["detail"].lower()
+
+
+def test_get_actual_cost_map_sums_visible_registrations(db: Session) -> None:
+    """Actual costs are summed per cost element, respecting the control date."""
+    from decimal import Decimal
+
+    from app.api.routes.cost_registrations import _get_actual_cost_map
+
+    cost_element = create_random_cost_element(db)
+    other_cost_element = create_random_cost_element(db)
+    for registration_date in (date(2024, 2, 1), date(2024, 3, 1), date(2024, 6, 1)):
+        create_random_cost_registration(
+            db,
+            cost_element_id=cost_element.cost_element_id,
+            registration_date=registration_date,
+        )
+
+    actual_cost_map = _get_actual_cost_map(
+        db,
+        [cost_element.cost_element_id, other_cost_element.cost_element_id],
+        date(2024, 3, 31),
+    )
+
+    assert actual_cost_map == {
+        cost_element.cost_element_id: Decimal("3000.00"),
+        other_cost_element.cost_element_id: Decimal("0.00"),
+    }
+    assert _get_actual_cost_map(db, [], date(2024, 3, 31)) == {}
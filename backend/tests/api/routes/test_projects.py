@@ -1,10 +1,15 @@
 import uuid
 from datetime import date, timedelta
+from typing import Any
+from unittest.mock import patch
 
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlmodel import Session, update
 
 from app.core.config import settings
+from app.core.db import engine
+from app.models import Project
+from app.services import entity_versioning
 from tests.utils.cost_element_type import create_random_cost_element_type
 from tests.utils.project import create_random_project
 from tests.utils.user import create_random_user
@@ -125,6 +130,39 @@ def test_update_project_not_found(
     assert content["detail"] == "Project not found"
 
 
+def test_update_project_concurrent_modification(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    """Test that losing an update race returns 409 instead of overwriting."""
+    project = create_random_project(db)
+    get_current_entity = entity_versioning._get_current_entity
+
+    def read_then_modify_concurrently(*args: Any, **kwargs: Any) -> Any:
+        current_entity = get_current_entity(*args, **kwargs)
+        # Another writer commits a new version after the route read the row
+        with Session(engine) as other_session:
+            other_session.execute(
+                update(Project)
+                .where(Project.project_id == project.project_id)  # type: ignore[arg-type]
+                .values(version=Project.version + 1)
+            )
+            other_session.commit()
+        return current_entity
+
+    with patch.object(
+        entity_versioning,
+        "_get_current_entity",
+        side_effect=read_then_modify_concurrently,
+    ):
+        response = client.put(
+            f"{settings.API_V1_STR}/projects/{project.project_id}",
+            headers=superuser_token_headers,
+            json={"project_name": "Updated Project Name"},
+        )
+    assert response.status_code == 409
+    assert "modified concurrently" in response.json()["detail"]
+
+
 def test_delete_project(
     client: TestClient, superuser_token_headers: dict[str, str], db: Session
 ) -> None:
@@ -10,6 +10,7 @@ from app.models import (
     VarianceThresholdConfigCreate,
     VarianceThresholdType,
 )
+from app.services.variance_analysis_report import get_active_variance_thresholds
 
 
 def test_create_variance_threshold_config(
@@ -314,3 +315,37 @@ def test_update_variance_threshold_config_deactivate_previous_active(
     db.refresh(config1)
     # Note: This depends on implementation - may need to be handled at service layer
     # For now, we expect the API to handle this
+
+
+def test_update_variance_threshold_config_refreshes_active_thresholds(
+    client: TestClient, superuser_token_headers: dict[str, str], db: Session
+) -> None:
+    """Test that threshold writes are visible despite the active threshold cache."""
+    config = db.exec(
+        select(VarianceThresholdConfig).where(
+            VarianceThresholdConfig.threshold_type == VarianceThresholdType.warning_cv,
+            VarianceThresholdConfig.is_active == True,  # noqa: E712
+        )
+    ).first()
+    if not config:
+        config_in = VarianceThresholdConfigCreate(
+            threshold_type=VarianceThresholdType.warning_cv,
+            threshold_percentage=Decimal("-5.00"),
+            is_active=True,
+        )
+        config = VarianceThresholdConfig.model_validate(config_in)
+        db.add(config)
+        db.commit()
+        db.refresh(config)
+
+    # Warm the cache, then change the threshold through the API
+    get_active_variance_thresholds(db)
+    response = client.put(
+        f"/api/v1/variance-threshold-configs/{config.variance_threshold_config_id}",
+        headers=superuser_token_headers,
+        json={"threshold_percentage": "-6.00"},
+    )
+
+    assert response.status_code == 200
+    thresholds = get_active_variance_thresholds(db)
+    assert thresholds["warning_cv"] == Decimal("-6.00")
@@ -281,6 +281,51 @@ def test_merge_branch_creates_new_versions_in_main(db: Session) -> None:
     assert main_versions[1].machine_type == "Branch WBE Modified"
 
 
+def test_merge_branch_assigns_sequential_versions_per_entity(db: Session) -> None:
+    """Test that several branch rows for one entity merge into consecutive main versions."""
+    pm_user = _create_pm_user(db)
+    project = _create_project(db, pm_user)
+    change_order = _create_change_order(db, project, pm_user)
+    branch = BranchService.create_branch(
+        db, change_order_id=change_order.change_order_id
+    )
+
+    from app.models import WBE
+
+    entity_id = uuid.uuid4()
+
+    for version, machine_type in ((1, "Branch WBE v1"), (2, "Branch WBE v2")):
+        db.add(
+            WBE(
+                entity_id=entity_id,
+                project_id=project.project_id,
+                machine_type=machine_type,
+                revenue_allocation=10000.00,
+                business_status="designing",
+                branch=branch,
+                version=version,
+                status="active",
+            )
+        )
+    db.commit()
+
+    BranchService.merge_branch(
+        session=db,
+        branch=branch,
+        change_order_id=change_order.change_order_id,
+    )
+    db.commit()
+
+    main_versions = db.exec(
+        select(WBE)
+        .where(WBE.entity_id == entity_id)
+        .where(WBE.branch == "main")
+        .order_by(WBE.version)
+    ).all()
+
+    assert [wbe.version for wbe in main_versions] == [1, 2]
+
+
 def test_merge_branch_last_write_wins(db: Session) -> None:
     """Test that merge uses last-write-wins (branch values overwrite main values)."""
     pm_user = _create_pm_user(db)
@@ -736,6 +781,14 @@ def test_merge_branch_is_transactional(db: Session) -> None:
     assert branch_wbe_final.status == "merged"  # Now merged
 
 
+def test_merge_branch_rejects_branch_of_other_change_order(db: Session) -> None:
+    """Test that merge_branch raises ValueError when the branch belongs to another change order."""
+    with pytest.raises(ValueError, match="does not match change order"):
+        BranchService.merge_branch(
+            session=db, branch="co-000000", change_order_id=uuid.uuid4()
+        )
+
+
 def test_delete_branch_sets_status_deleted(db: Session) -> None:
     """Test that delete_branch sets status='deleted' for all branch entities."""
     pm_user = _create_pm_user(db)
@@ -19,7 +19,12 @@ from app.models import (
     UserCreate,
     WBECreate,
 )
-from app.services.cost_performance_report import get_cost_performance_report
+from app.models.cost_performance_report import CostPerformanceReportPublic
+from app.services.cost_performance_report import (
+    get_cost_performance_report,
+    get_cost_performance_summary,
+    iter_cost_performance_rows,
+)
 
 
 def test_get_cost_performance_report_empty_project(db: Session) -> None:
@@ -435,3 +440,43 @@ def test_get_cost_performance_report_time_machine_filtering(db: Session) -> None
 
     # Cost element should be included (created_at <= control_date)
     assert len(report.rows) == 1
+
+
+def test_get_cost_performance_report_matches_validated_models(db: Session) -> None:
+    """Test that the unvalidated report models equal their validated equivalents."""
+    from tests.utils.cost_element import create_random_cost_element
+    from tests.utils.cost_registration import create_random_cost_registration
+
+    ce = create_random_cost_element(db)
+    create_random_cost_registration(
+        db, cost_element_id=ce.cost_element_id, registration_date=date.today()
+    )
+    wbe = db.get(WBE, ce.wbe_id)
+    assert wbe is not None
+
+    report = get_cost_performance_report(db, wbe.project_id, date.today())
+
+    validated = CostPerformanceReportPublic.model_validate(report.model_dump())
+    assert validated == report
+    assert validated.model_dump_json() == report.model_dump_json()
+
+
+def test_cost_performance_rows_and_summary_match_report(db: Session) -> None:
+    """Test that the row iterator and summary agree with the full report."""
+    from tests.utils.cost_element import create_random_cost_element
+    from tests.utils.cost_registration import create_random_cost_registration
+
+    ce = create_random_cost_element(db)
+    create_random_cost_registration(
+        db, cost_element_id=ce.cost_element_id, registration_date=date.today()
+    )
+    wbe = db.get(WBE, ce.wbe_id)
+    assert wbe is not None
+
+    report = get_cost_performance_report(db, wbe.project_id, date.today())
+    rows = list(iter_cost_performance_rows(db, wbe.project_id, date.today()))
+    summary = get_cost_performance_summary(db, wbe.project_id, date.today())
+
+    assert rows == report.rows
+    assert summary == report.summary
+    assert summary.actual_cost == Decimal("1500.00")
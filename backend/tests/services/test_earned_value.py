@@ -1,9 +1,12 @@
 """Unit tests for earned value calculation helpers."""
 
 import uuid
+from dataclasses import FrozenInstanceError
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
+import pytest
+
 from app.models import CostElement, EarnedValueEntry
 from app.services.earned_value import (
     _select_latest_entry_for_control_date,
@@ -382,6 +385,15 @@ def test_aggregate_earned_value_empty_list() -> None:
     assert result.percent_complete == Decimal("0.0000")
 
 
+def test_aggregate_earned_value_empty_result_is_shared_and_frozen() -> None:
+    """Empty aggregates reuse one immutable result."""
+    result = aggregate_earned_value([])
+
+    assert aggregate_earned_value([]) is result
+    with pytest.raises(FrozenInstanceError):
+        result.earned_value = Decimal("1.00")  # type: ignore[misc]
+
+
 def test_aggregate_earned_value_different_percents() -> None:
     """Should correctly aggregate cost elements with different completion percentages."""
     tuples = [
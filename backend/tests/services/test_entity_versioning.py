@@ -0,0 +1,141 @@
+"""Tests for entity versioning helpers."""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlmodel import Session, update
+
+from app.models import WBE, Project
+from app.services.entity_versioning import (
+    ConcurrentModificationError,
+    bulk_create_entities_with_version,
+    bulk_update_entities_with_version,
+    update_entity_with_version,
+)
+from tests.utils.project import create_random_project
+
+
+def _new_wbe(project_id: uuid.UUID, entity_id: uuid.UUID | None = None) -> WBE:
+    return WBE(
+        entity_id=entity_id or uuid.uuid4(),
+        project_id=project_id,
+        machine_type="Bulk WBE",
+        revenue_allocation=Decimal("1000.00"),
+        business_status="designing",
+    )
+
+
+def test_bulk_create_entities_with_version_numbers_each_entity(db: Session) -> None:
+    """Test that bulk creation assigns per-entity versions like single creation."""
+    project = create_random_project(db)
+    shared_id = uuid.uuid4()
+
+    created = bulk_create_entities_with_version(
+        db,
+        [
+            _new_wbe(project.project_id, shared_id),
+            _new_wbe(project.project_id),
+            _new_wbe(project.project_id, shared_id),
+        ],
+        entity_type="wbe",
+    )
+    db.commit()
+
+    assert [wbe.version for wbe in created] == [1, 1, 2]
+    assert all(wbe.status == "active" and wbe.branch == "main" for wbe in created)
+
+
+def test_bulk_update_entities_with_version_numbers_each_entity(db: Session) -> None:
+    """Test that bulk updates number distinct and repeated entity_ids like single updates."""
+    project = create_random_project(db)
+    shared_id = uuid.uuid4()
+    # Both versions of the shared entity stay active in the main branch
+    shared_v1, other, shared_v2 = bulk_create_entities_with_version(
+        db,
+        [
+            _new_wbe(project.project_id, shared_id),
+            _new_wbe(project.project_id),
+            _new_wbe(project.project_id, shared_id),
+        ],
+        entity_type="wbe",
+    )
+    db.commit()
+
+    updated = bulk_update_entities_with_version(
+        db,
+        WBE,
+        {
+            shared_v1.wbe_id: {"machine_type": "Shared A"},
+            other.wbe_id: {"machine_type": "Other"},
+            shared_v2.wbe_id: {"machine_type": "Shared B"},
+        },
+        entity_type="wbe",
+        branch="main",
+    )
+    db.commit()
+
+    assert [(wbe.entity_id, wbe.version) for wbe in updated] == [
+        (shared_id, 3),
+        (other.entity_id, 2),
+        (shared_id, 4),
+    ]
+    assert [wbe.machine_type for wbe in updated] == ["Shared A", "Other", "Shared B"]
+
+
+def test_update_entity_with_version_uses_version_cache(db: Session) -> None:
+    """Test that consecutive updates sharing a cache keep incrementing versions."""
+    project = create_random_project(db)
+    (wbe,) = bulk_create_entities_with_version(
+        db, [_new_wbe(project.project_id)], entity_type="wbe"
+    )
+    db.commit()
+
+    version_cache: dict[tuple[uuid.UUID, str | None], int] = {}
+    first = update_entity_with_version(
+        db,
+        WBE,
+        wbe.wbe_id,
+        {"machine_type": "First"},
+        entity_type="wbe",
+        branch="main",
+        version_cache=version_cache,
+    )
+    second = update_entity_with_version(
+        db,
+        WBE,
+        wbe.wbe_id,
+        {"machine_type": "Second"},
+        entity_type="wbe",
+        branch="main",
+        version_cache=version_cache,
+    )
+    db.commit()
+
+    assert (first.version, second.version) == (2, 3)
+    assert version_cache[(wbe.entity_id, "main")] == 4
+
+
+def test_update_in_place_detects_concurrent_modification(db: Session) -> None:
+    """Test that an in-place update does not overwrite a row changed since it was read."""
+    project = create_random_project(db)
+
+    updated = update_entity_with_version(
+        db, Project, project.project_id, {"project_name": "Renamed"}, "project"
+    )
+    db.commit()
+    assert (updated.project_name, updated.version) == ("Renamed", 2)
+
+    # Another writer bumps the version behind the loaded instance's back
+    db.execute(
+        update(Project)
+        .where(Project.project_id == project.project_id)  # type: ignore[arg-type]
+        .values(version=Project.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+    with pytest.raises(ConcurrentModificationError):
+        update_entity_with_version(
+            db, Project, project.project_id, {"project_name": "Stale"}, "project"
+        )
+    db.rollback()
@@ -3,6 +3,8 @@
 from datetime import date
 from decimal import Decimal
 
+import pytest
+
 from app.models import (
     CostElement,
     CostElementSchedule,
@@ -384,6 +386,43 @@ def test_get_cost_element_evm_metrics_tcpi_overrun() -> None:
     assert result.tcpi == "overrun"  # BAC ≤ AC
 
 
+def test_get_cost_element_evm_metrics_uses_pre_aggregated_actual_cost() -> None:
+    """Should use actual_cost as AC when it is given instead of registrations."""
+    cost_element = _create_test_cost_element(budget_bac=Decimal("100000.00"))
+
+    result = get_cost_element_evm_metrics(
+        cost_element=cost_element,
+        schedule=None,
+        entry=None,
+        control_date=date(2024, 6, 15),
+        actual_cost=Decimal("25000.00"),
+    )
+
+    assert result.actual_cost == Decimal("25000.00")
+
+
+def test_get_cost_element_evm_metrics_requires_exactly_one_ac_source() -> None:
+    """Should reject calls passing both or neither of registrations and actual_cost."""
+    cost_element = _create_test_cost_element(budget_bac=Decimal("100000.00"))
+
+    with pytest.raises(ValueError):
+        get_cost_element_evm_metrics(
+            cost_element=cost_element,
+            schedule=None,
+            entry=None,
+            control_date=date(2024, 6, 15),
+        )
+    with pytest.raises(ValueError):
+        get_cost_element_evm_metrics(
+            cost_element=cost_element,
+            schedule=None,
+            entry=None,
+            cost_registrations=[],
+            control_date=date(2024, 6, 15),
+            actual_cost=Decimal("0.00"),
+        )
+
+
 def test_get_cost_element_evm_metrics_all_none() -> None:
     """Should handle all None/empty inputs correctly."""
     cost_element = _create_test_cost_element(budget_bac=Decimal("100000.00"))
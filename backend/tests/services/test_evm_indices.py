@@ -6,6 +6,7 @@ from decimal import Decimal
 from app.models.evm_indices import EVMIndicesBase
 from app.services.evm_indices import (
     aggregate_evm_indices,
+    calculate_all_indices,
     calculate_cost_variance,
     calculate_cpi,
     calculate_schedule_variance,
@@ -183,6 +184,27 @@ def test_calculate_tcpi_negative_values() -> None:
     assert result == Decimal("1.3750")
 
 
+def test_calculate_all_indices_matches_individual_functions() -> None:
+    """calculate_all_indices should agree with the individual index functions."""
+    cases = [
+        # (pv, ev, ac, bac)
+        (Decimal("100.00"), Decimal("80.00"), Decimal("90.00"), Decimal("1000.00")),
+        (Decimal("0.00"), Decimal("50.00"), Decimal("0.00"), Decimal("200.00")),
+        (Decimal("0.00"), Decimal("0.00"), Decimal("0.00"), Decimal("0.00")),
+        (Decimal("300.00"), Decimal("250.00"), Decimal("500.00"), Decimal("500.00")),
+        (Decimal("100.00"), Decimal("-100.00"), Decimal("200.00"), Decimal("1000.00")),
+    ]
+
+    for pv, ev, ac, bac in cases:
+        result = calculate_all_indices(pv, ev, ac, bac)
+
+        assert result.cost_variance == calculate_cost_variance(ev, ac)
+        assert result.schedule_variance == calculate_schedule_variance(ev, pv)
+        assert result.cpi == calculate_cpi(ev, ac)
+        assert result.spi == calculate_spi(ev, pv)
+        assert result.tcpi == calculate_tcpi(bac, ev, ac)
+
+
 def test_aggregate_evm_indices_multiple_elements() -> None:
     """Aggregation should sum PV, EV, AC, BAC across multiple elements."""
     values = [
@@ -0,0 +1,244 @@
+"""Tests for variance analysis report service."""
+
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+from sqlmodel import Session, select
+
+from app.api.routes.cost_registrations import _get_actual_cost_map
+from app.api.routes.earned_value import _get_entry_map
+from app.api.routes.planned_value import _get_schedule_map
+from app.models import WBE, CostElement, Project
+from app.services.evm_aggregation import get_cost_element_evm_metrics
+from app.services.time_machine import end_of_day
+from app.services.variance_analysis_report import (
+    _calculate_variance_percentage,
+    _generate_monthly_periods,
+    get_variance_trend,
+)
+from tests.utils.cost_element import create_random_cost_element
+from tests.utils.cost_element_schedule import create_schedule_for_cost_element
+from tests.utils.cost_registration import create_random_cost_registration
+from tests.utils.earned_value_entry import create_earned_value_entry
+from tests.utils.project import create_random_project
+from tests.utils.wbe import create_random_wbe
+
+PROJECT_START = date(2024, 1, 1)
+TREND_CONTROL_DATE = date(2024, 6, 20)
+
+
+def _utc(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, 12, 0, tzinfo=timezone.utc)
+
+
+def _create_trend_project(db: Session) -> tuple[Project, WBE]:
+    """Create a project starting on PROJECT_START with one WBE."""
+    project = create_random_project(db)
+    project.start_date = PROJECT_START
+    db.add(project)
+    db.commit()
+    db.refresh(project)
+    return project, create_random_wbe(db, project_id=project.project_id)
+
+
+def _create_trend_cost_element(
+    db: Session, wbe_id: uuid.UUID, created_at: datetime
+) -> CostElement:
+    cost_element = create_random_cost_element(db, wbe_id=wbe_id)
+    cost_element.created_at = created_at
+    db.add(cost_element)
+    db.commit()
+    db.refresh(cost_element)
+    return cost_element
+
+
+def _expected_trend_points(
+    db: Session,
+    project_id: uuid.UUID,
+    control_date: date,
+    cost_element_id: uuid.UUID | None = None,
+) -> list[tuple[date, Decimal, Decimal, Decimal | None, Decimal | None]]:
+    """Recompute every trend point with single-month time-machine lookups."""
+    points = []
+    for month_start, month_control_date in _generate_monthly_periods(
+        PROJECT_START, control_date
+    ):
+        if cost_element_id is not None:
+            cost_element = db.get(CostElement, cost_element_id)
+            cost_elements = [cost_element] if cost_element else []
+        else:
+            cost_elements = list(
+                db.exec(
+                    select(CostElement)
+                    .join(WBE)
+                    .where(
+                        WBE.project_id == project_id,
+                        CostElement.created_at <= end_of_day(month_control_date),
+                    )
+                ).all()
+            )
+        if not cost_elements:
+            continue
+
+        cost_element_ids = [ce.cost_element_id for ce in cost_elements]
+        schedule_map = _get_schedule_map(db, cost_element_ids, month_control_date)
+        entry_map = _get_entry_map(db, cost_element_ids, month_control_date)
+        actual_cost_map = _get_actual_cost_map(db, cost_element_ids, month_control_date)
+
+        total_cv = total_sv = total_bac = Decimal("0.00")
+        for cost_element in cost_elements:
+            metrics = get_cost_element_evm_metrics(
+                cost_element=cost_element,
+                schedule=schedule_map.get(cost_element.cost_element_id),
+                entry=entry_map.get(cost_element.cost_element_id),
+                control_date=month_control_date,
+                actual_cost=actual_cost_map[cost_element.cost_element_id],
+            )
+            total_cv += metrics.cost_variance
+            total_sv += metrics.schedule_variance
+            total_bac += metrics.budget_bac
+
+        points.append(
+            (
+                month_start,
+                total_cv,
+                total_sv,
+                _calculate_variance_percentage(total_cv, total_bac),
+                _calculate_variance_percentage(total_sv, total_bac),
+            )
+        )
+    return points
+
+
+def _trend_points(
+    db: Session,
+    project_id: uuid.UUID,
+    control_date: date,
+    cost_element_id: uuid.UUID | None = None,
+) -> list[tuple[date, Decimal, Decimal, Decimal | None, Decimal | None]]:
+    trend = get_variance_trend(
+        db, project_id, control_date, cost_element_id=cost_element_id
+    )
+    return [
+        (
+            point.month,
+            point.cost_variance,
+            point.schedule_variance,
+            point.cv_percentage,
+            point.sv_percentage,
+        )
+        for point in trend.trend_points
+    ]
+
+
+def test_variance_trend_counts_late_created_registration_from_creation_month(
+    db: Session,
+) -> None:
+    """Test that a registration created after its registration month counts from creation."""
+    project, wbe = _create_trend_project(db)
+    cost_element = _create_trend_cost_element(db, wbe.wbe_id, _utc(2024, 1, 2))
+    create_random_cost_registration(
+        db,
+        cost_element_id=cost_element.cost_element_id,
+        registration_date=date(2024, 2, 10),
+        created_at=_utc(2024, 4, 5),
+    )
+
+    points = _trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+
+    assert points == _expected_trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+    cost_variances = [point[1] for point in points]
+    assert cost_variances[:3] == [Decimal("0.00")] * 3
+    assert cost_variances[3] == Decimal("-1500.00")
+
+
+def test_variance_trend_switches_to_re_registered_schedule(db: Session) -> None:
+    """Test that a schedule registered later replaces the earlier one from then on."""
+    project, wbe = _create_trend_project(db)
+    cost_element = _create_trend_cost_element(db, wbe.wbe_id, _utc(2024, 1, 2))
+    for end_date, registration_date in (
+        (date(2024, 12, 31), date(2024, 1, 5)),
+        (date(2024, 4, 30), date(2024, 3, 20)),
+    ):
+        schedule = create_schedule_for_cost_element(
+            db,
+            cost_element.cost_element_id,
+            start_date=date(2024, 1, 1),
+            end_date=end_date,
+            registration_date=registration_date,
+        )
+        schedule.created_at = _utc(
+            registration_date.year, registration_date.month, registration_date.day
+        )
+        db.add(schedule)
+        db.commit()
+
+    points = _trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+
+    assert points == _expected_trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+    # Nothing is earned, so SV = -PV; the shorter schedule plans all of BAC
+    # by the end of April
+    assert points[4][2] == Decimal("-10000.00")
+
+
+def test_variance_trend_counts_late_registered_entry_from_registration(
+    db: Session,
+) -> None:
+    """Test that an entry registered after its completion date counts from registration."""
+    project, wbe = _create_trend_project(db)
+    cost_element = _create_trend_cost_element(db, wbe.wbe_id, _utc(2024, 1, 2))
+    create_earned_value_entry(
+        db,
+        cost_element_id=cost_element.cost_element_id,
+        completion_date=date(2024, 2, 15),
+        percent_complete=Decimal("40.00"),
+        registration_date=date(2024, 5, 3),
+    )
+
+    points = _trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+
+    assert points == _expected_trend_points(
+        db, project.project_id, TREND_CONTROL_DATE, cost_element.cost_element_id
+    )
+    cost_variances = [point[1] for point in points]
+    assert cost_variances[:4] == [Decimal("0.00")] * 4
+    assert cost_variances[4] == Decimal("4000.00")
+
+
+def test_variance_trend_includes_cost_element_from_creation_month(
+    db: Session,
+) -> None:
+    """Test that a cost element created mid-window joins the project trend then."""
+    project, wbe = _create_trend_project(db)
+    early = _create_trend_cost_element(db, wbe.wbe_id, _utc(2024, 1, 2))
+    late = _create_trend_cost_element(db, wbe.wbe_id, _utc(2024, 3, 15))
+    for cost_element, registration_date in (
+        (early, date(2024, 1, 10)),
+        (late, date(2024, 3, 20)),
+    ):
+        create_random_cost_registration(
+            db,
+            cost_element_id=cost_element.cost_element_id,
+            registration_date=registration_date,
+        )
+
+    points = _trend_points(db, project.project_id, TREND_CONTROL_DATE)
+
+    assert points == _expected_trend_points(db, project.project_id, TREND_CONTROL_DATE)
+    # Each cost element has BAC 10000 and AC 1500; before March only the early
+    # one is in scope, so its BAC alone is the percentage base
+    assert [point[1] for point in points] == [Decimal("-1500.00")] * 2 + [
+        Decimal("-3000.00")
+    ] * 4
+    assert all(point[3] == Decimal("-15.00") for point in points)
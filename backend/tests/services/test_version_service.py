@@ -3,6 +3,7 @@
 import uuid
 from datetime import date
 
+import pytest
 from sqlmodel import Session
 
 from app import crud
@@ -151,3 +152,65 @@ def test_get_next_version_version_only_entity(db: Session) -> None:
     )
 
     assert version == 1
+
+
+def test_get_next_versions_bulk(db: Session) -> None:
+    """Test that get_next_versions_bulk resolves several entities in one call."""
+    existing_id = uuid.uuid4()
+    new_id = uuid.uuid4()
+    _create_wbe(db, entity_id=existing_id, branch="main", version=1)
+    _create_wbe(db, entity_id=existing_id, branch="main", version=2)
+
+    versions = VersionService.get_next_versions_bulk(
+        session=db,
+        entity_type="wbe",
+        entity_ids=[existing_id, new_id],
+        branch="main",
+    )
+
+    assert versions == {existing_id: 3, new_id: 1}
+
+
+def test_allocate_and_insert_assigns_next_version(db: Session) -> None:
+    """Test that allocate_and_insert picks the next version in the insert itself."""
+    entity_id = uuid.uuid4()
+    wbe = _create_wbe(db, entity_id=entity_id, branch="main", version=1)
+    values = {
+        "project_id": wbe.project_id,
+        "machine_type": "Test WBE",
+        "revenue_allocation": 10000.0,
+        "business_status": "designing",
+        "status": "active",
+    }
+
+    version_main = VersionService.allocate_and_insert(
+        session=db, model_class=WBE, values=values, entity_id=entity_id, branch="main"
+    )
+    version_co = VersionService.allocate_and_insert(
+        session=db,
+        model_class=WBE,
+        values=values,
+        entity_id=entity_id,
+        branch="co-001",
+    )
+    db.commit()
+
+    assert version_main == 2
+    assert version_co == 1
+    assert (
+        VersionService.get_next_version(
+            session=db, entity_type="wbe", entity_id=entity_id, branch="main"
+        )
+        == 3
+    )
+
+
+def test_get_model_class_accepts_snake_case_and_concatenated_names() -> None:
+    """Test that entity type names resolve with or without underscores."""
+    assert VersionService.get_model_class("cost_element_schedule") is (
+        VersionService.get_model_class("costelementschedule")
+    )
+    assert VersionService.get_model_class("WBE") is WBE
+
+    with pytest.raises(ValueError, match="Unknown entity type"):
+        VersionService.get_model_class("not_an_entity")